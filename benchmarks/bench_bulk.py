@@ -0,0 +1,42 @@
+"""Compare resolving dates one at a time with Lectionary against resolving
+them all at once with pylect.bulk.resolve_dates.
+
+Usage: python benchmarks/bench_bulk.py [number_of_dates]
+"""
+
+import sys
+from datetime import date
+from timeit import default_timer as timer
+
+import numpy as np
+
+from pylect.bulk import resolve_dates
+from pylect.lectionary import Lectionary
+
+
+def main() -> None:
+    """Run the benchmark and print the timings."""
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = np.random.default_rng(0)
+    first = date(1900, 1, 1).toordinal()
+    last = date(2300, 12, 31).toordinal()
+    ordinals = rng.integers(first, last, size=count)
+
+    start = timer()
+    for ordinal in ordinals:
+        Lectionary(date.fromordinal(int(ordinal)))
+    per_date = timer() - start
+
+    start = timer()
+    resolve_dates(ordinals)
+    bulk = timer() - start
+
+    print(f"dates:          {count}")
+    print(f"Lectionary:     {per_date:.3f}s")
+    print(f"resolve_dates:  {bulk:.3f}s")
+    print(f"speedup:        {per_date / bulk:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
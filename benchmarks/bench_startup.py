@@ -0,0 +1,58 @@
+"""Measure how long it takes to import Pylect's modules, using the timings
+reported by `python -X importtime` in a fresh interpreter for each run.
+
+Usage: python benchmarks/bench_startup.py [--max-ms N] [module ...]
+
+With --max-ms, the script exits with a non-zero status if the best time
+for any module is over the limit, so it can guard against regressions.
+"""
+
+import re
+import subprocess
+import sys
+
+MODULES = ["pylect.lectionary", "pylect.liturgicalyear", "pylect.cli"]
+RUNS = 5
+
+IMPORT_TIME = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| (\S+)$")
+
+
+def get_import_time(module: str) -> float:
+    """Get the cumulative time in milliseconds spent importing module."""
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME.match(line)
+        if match and match.group(2) == module:
+            return int(match.group(1)) / 1000
+    raise ValueError(f"Error: no import time reported for {module}")
+
+
+def main() -> None:
+    """Run the benchmark and print the best time for each module."""
+
+    args = sys.argv[1:]
+    max_ms = None
+    if args[:1] == ["--max-ms"]:
+        max_ms = float(args[1])
+        args = args[2:]
+
+    failed = False
+    for module in args or MODULES:
+        best = min(get_import_time(module) for _ in range(RUNS))
+        print(f"{module:24}{best:8.1f}ms")
+        if max_ms is not None and best > max_ms:
+            failed = True
+
+    if failed:
+        print(f"Error: import time is over {max_ms}ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Provides functions for resolving large arrays of dates against the
+liturgical calendar at once. This module requires NumPy, which can be
+installed with `pip install pylect[numpy]`.
+"""
+
+from datetime import date
+from functools import lru_cache
+
+import numpy as np
+
+from pylect.liturgicalyear import LiturgicalYear
+from pylect.observances import CALENDAR
+
+SEASONS: tuple[str, ...] = (
+    "Advent",
+    "Christmas",
+    "Epiphany",
+    "Lent",
+    "Easter",
+    "Pentecost",
+)
+
+LITURGICAL_YEARS: tuple[str, ...] = ("Year A", "Year B", "Year C")
+
+HOLY_DAY_NAMES: tuple[str, ...] = tuple(CALENDAR.priorities)
+
+NONE = -1
+
+SEASON_CODES = {season: i for i, season in enumerate(SEASONS)}
+LITURGICAL_YEAR_CODES = {year: i for i, year in enumerate(LITURGICAL_YEARS)}
+HOLY_DAY_CODES = {name: i for i, name in enumerate(HOLY_DAY_NAMES)}
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class ResolvedDates:
+    """The ResolvedDates class holds parallel arrays of codes describing
+    each date passed to resolve_dates. Seasons, lectionary years and holy
+    day names are indices into SEASONS, LITURGICAL_YEARS, and
+    HOLY_DAY_NAMES. Ranks are the values of the Rank enum. Dates on which
+    no holy day falls have a rank and holy day code of NONE.
+    """
+
+    def __init__(
+        self,
+        season: np.ndarray,
+        liturgical_year: np.ndarray,
+        rank: np.ndarray,
+        holy_day: np.ndarray,
+    ) -> None:
+        self.season: np.ndarray = season
+        self.liturgical_year: np.ndarray = liturgical_year
+        self.rank: np.ndarray = rank
+        self.holy_day: np.ndarray = holy_day
+
+    def __len__(self) -> int:
+        return len(self.season)
+
+
+def resolve_dates(dates: np.ndarray) -> ResolvedDates:
+    """Resolve an array of dates against the liturgical calendar.
+
+    The dates may be given as a datetime64 array of any unit or as an
+    integer array of proleptic Gregorian ordinals (as returned by
+    `date.toordinal()`). The moveable dates are calculated only once for
+    each distinct year in the array, and the results for every date are
+    then gathered from the per-year tables in a single vectorized step.
+
+    When more than one holy day falls on a date, the one with the highest
+    rank is reported.
+    """
+
+    dates = np.asarray(dates)
+    if np.issubdtype(dates.dtype, np.datetime64):
+        days = dates.astype("datetime64[D]").astype(np.int64)
+    elif np.issubdtype(dates.dtype, np.integer):
+        days = dates.astype(np.int64) - EPOCH_ORDINAL
+    else:
+        raise TypeError(f"Error: unsupported date array type {dates.dtype}")
+
+    if days.size == 0:
+        empty = np.empty(days.shape, dtype=np.int8)
+        return ResolvedDates(empty, empty, empty, empty.astype(np.int16))
+
+    years = days.astype("datetime64[D]").astype("datetime64[Y]")
+    day_of_year = days - years.astype("datetime64[D]").astype(np.int64)
+    unique_years, year_index = np.unique(
+        years.astype(np.int64) + 1970, return_inverse=True
+    )
+
+    tables = np.stack([_get_year_codes(int(y)) for y in unique_years])
+    codes = tables[year_index.reshape(days.shape), :, day_of_year]
+
+    return ResolvedDates(
+        codes[..., 0].astype(np.int8),
+        codes[..., 1].astype(np.int8),
+        codes[..., 2].astype(np.int8),
+        codes[..., 3],
+    )
+
+
+@lru_cache(maxsize=512)
+def _get_year_codes(year: int) -> np.ndarray:
+    """Encode a LiturgicalYear as a (4, 366) array of season, lectionary
+    year, rank, and holy day codes for each day of the year.
+    """
+
+    liturgical_year = LiturgicalYear(year)
+    codes = np.full((4, 366), NONE, dtype=np.int16)
+    length = liturgical_year.length
+    codes[0, :length] = [
+        SEASON_CODES[s] for s in liturgical_year.liturgical_seasons
+    ]
+    codes[1, :length] = [
+        LITURGICAL_YEAR_CODES[y] for y in liturgical_year.liturgical_years
+    ]
+    for i, holy_days in enumerate(liturgical_year.holy_days):
+        if holy_days:
+            primary = max(holy_days, key=lambda d: d.rank.value)
+            codes[2, i] = primary.rank.value
+            codes[3, i] = HOLY_DAY_CODES[primary.name]
+    codes.flags.writeable = False
+    return codes
@@ -0,0 +1,49 @@
+"""Provides access to the CircuitBreaker class."""
+
+import threading
+import time
+
+
+class CircuitBreaker:
+    """The CircuitBreaker class keeps track of consecutive failures when
+    calling an outside service. Once failure_threshold calls in a row have
+    failed, the circuit opens and allow() returns False, so callers can
+    fail immediately instead of waiting on a service that is down. After
+    reset_timeout seconds, calls are allowed through again to test whether
+    the service has recovered; a single success closes the circuit, while
+    another failure opens it for a further reset_timeout seconds.
+    """
+
+    def __init__(
+        self, failure_threshold: int = 5, reset_timeout: float = 30.0
+    ) -> None:
+        self.failure_threshold: int = failure_threshold
+        self.reset_timeout: float = reset_timeout
+        self.__failures: int = 0
+        self.__opened_at: float | None = None
+        self.__lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Check whether a call should be attempted."""
+
+        with self.__lock:
+            if self.__opened_at is None:
+                return True
+            return time.monotonic() - self.__opened_at >= self.reset_timeout
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+
+        with self.__lock:
+            self.__failures = 0
+            self.__opened_at = None
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit if there have been too
+        many failures in a row.
+        """
+
+        with self.__lock:
+            self.__failures += 1
+            if self.__failures >= self.failure_threshold:
+                self.__opened_at = time.monotonic()
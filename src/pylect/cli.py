@@ -3,31 +3,75 @@ is initiated when the program is started and begin running a script
 that gather the appropriate readings for the lectionary for the given
 date range. It then prompts the user to select one or more of the
 readings so that it can fetch the texts and copy them to the system
-clipboard.
+clipboard. The holy days can also be written as JSON Lines or CSV for
+use by other programs.
 """
 
+import argparse
+import csv
+import json
+import os
 import sys
+from collections.abc import Iterable, Iterator
 from datetime import date, timedelta
+from pathlib import Path
+from timeit import default_timer as timer
+from typing import TextIO
 
-import pyperclip
-
-from pylect.esv import get_esv_text
 from pylect.holyday import HolyDay
-from pylect.lectionary import Lectionary
-from pylect.psalter import Psalter
+from pylect.ics import write_ics
+from pylect.lectionary import iter_holy_days
+from pylect.psalter import get_psalter
+
+COMMANDS = ("list", "export")
+
+OUTPUT_FORMATS = ("text", "jsonl", "csv", "ics")
+
+RECORD_FIELDS = ["date", "name", "season", "year", "rank", "lessons"]
 
 
 def start() -> None:
-    """Start the Pylect CLI tool and print all the upcoming days and lessons
-    found in the lectionary.
+    """Start the Pylect CLI tool and run the command given on the command
+    line, which lists the upcoming holy days when no command is given.
+    """
+
+    args = parse_args(sys.argv[1:])
+    args.run(args)
+
+
+def list_holy_days(args: argparse.Namespace) -> None:
+    """Print all the holy days and lessons found in the lectionary between
+    the start and end dates, either for the interactive prompt or as
+    records for other programs.
     """
 
-    holy_days = check_lectionary()
+    start_date = args.start_date or date.today()
+    end_date = args.end_date or start_date + timedelta(days=7)
+
+    if args.format != "text":
+        if args.format == "ics":
+            # iCalendar lines must end in CRLF on every platform.
+            sys.stdout.reconfigure(newline="")
+        try:
+            write_records(
+                check_lectionary(start_date, end_date),
+                sys.stdout,
+                args.format,
+            )
+        except BrokenPipeError:
+            # The reader went away, as with `pylect ... | head`. Python
+            # flushes stdout on exit, so point it somewhere harmless first.
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            sys.exit(1)
+        return
+
+    holy_days: list[HolyDay] = []
 
     print()
     print("*** Welcome to the Pylect CLI ***\n")
     print("Here are the upcoming days in the lectionary:\n")
-    for i, day in enumerate(holy_days):
+    for i, (_, day) in enumerate(check_lectionary(start_date, end_date)):
+        holy_days.append(day)
         print(f"{i + 1})\t{day.name}:")
         for v in day.lessons.values():
             print(f"\t- {" or ".join(v)}")
@@ -44,6 +88,13 @@ def start() -> None:
 def loop(holy_days: list[HolyDay]) -> None:
     """Interactive loop for the Pylect CLI tool."""
 
+    # The HTTP client and clipboard support are slow to import, so they are
+    # only loaded once the calendar has been printed.
+    # pylint: disable=import-outside-toplevel
+    import pyperclip
+
+    from pylect.esv import MissingApiKeyError, get_esv_texts
+
     while True:
         choice = input("Please enter your choice: ")
 
@@ -56,15 +107,18 @@ def loop(holy_days: list[HolyDay]) -> None:
             print("Error: invalid selection")
             continue
 
-        psalter = Psalter()
-
         try:
             texts = [day.name]
+            queries = [v[0] for k, v in day.lessons.items() if k != "Psalm"]
+            esv_texts = iter(get_esv_texts(queries))
             for k, v in day.lessons.items():
                 if k == "Psalm":
-                    texts.append(psalter.get_psalm(v[0]))
+                    texts.append(get_psalter().get_psalm(v[0]))
                 else:
-                    texts.append(get_esv_text(v[0]))
+                    texts.append(next(esv_texts))
+        except MissingApiKeyError as exc:
+            print(exc)
+            sys.exit(1)
         except ValueError:
             print("Error: could not fetch requested texts")
             continue
@@ -73,42 +127,163 @@ def loop(holy_days: list[HolyDay]) -> None:
         print(f"Lessons for {day.name} copied to clipboard!")
 
 
-def check_lectionary() -> list[HolyDay]:
-    """Iterate through a range of dates and search for their corresponding
-    holy days in the lectionary.
+def export(args: argparse.Namespace) -> None:
+    """Write a bulletin for every holy day in a range of dates to a
+    directory, without any prompts."""
+
+    # pylint: disable=import-outside-toplevel
+    from pylect.export import export_bulletins
+
+    started = timer()
+    try:
+        paths = export_bulletins(
+            args.start_date, args.end_date, args.out, args.format
+        )
+    except ValueError as exc:
+        print(exc)
+        sys.exit(1)
+    print(
+        f"Exported {len(paths)} bulletins to {args.out}"
+        f" in {timer() - started:.2f}s"
+    )
+
+
+def check_lectionary(
+    start_date: date, end_date: date
+) -> Iterator[tuple[date, HolyDay]]:
+    """Iterate through a range of dates and yield their corresponding holy
+    days in the lectionary as they are found.
     """
 
-    start_date: date
-    end_date: date
+    yield from iter_holy_days(start_date, end_date)
 
-    if len(sys.argv) == 2:
-        try:
-            start_arg = [int(x) for x in sys.argv[1].split("-")]
-            start_date = date(start_arg[0], start_arg[1], start_arg[2])
-            end_date = start_date + timedelta(days=7)
-        except IndexError:
-            print("Error: Invalid date format in arguments")
-            sys.exit(1)
-    elif len(sys.argv) == 3:
-        try:
-            start_arg = [int(x) for x in sys.argv[1].split("-")]
-            start_date = date(start_arg[0], start_arg[1], start_arg[2])
-            end_arg = [int(x) for x in sys.argv[2].split("-")]
-            end_date = date(end_arg[0], end_arg[1], end_arg[2])
-        except IndexError:
-            print("Error: Invalid date format in arguments")
-            sys.exit(1)
+
+def get_record(this_date: date, day: HolyDay) -> dict:
+    """Get the machine-readable record for a holy day."""
+
+    return {
+        "date": this_date.isoformat(),
+        "name": day.name,
+        "season": day.season,
+        "year": day.year,
+        "rank": day.rank.name,
+        "lessons": dict(day.lessons),
+    }
+
+
+def write_records(
+    holy_days: Iterable[tuple[date, HolyDay]], output: TextIO, fmt: str
+) -> None:
+    """Write one record for each holy day to output as JSON Lines, CSV, or
+    iCalendar events, as each holy day is found. In CSV, the lessons are
+    written as a JSON object in a single column."""
+
+    if fmt == "ics":
+        write_ics(holy_days, output, name="Lectionary")
+    elif fmt == "csv":
+        writer = csv.DictWriter(output, fieldnames=RECORD_FIELDS)
+        writer.writeheader()
+        for this_date, day in holy_days:
+            record = get_record(this_date, day)
+            record["lessons"] = json.dumps(record["lessons"])
+            writer.writerow(record)
     else:
-        start_date = date.today()
-        end_date = start_date + timedelta(days=7)
+        for this_date, day in holy_days:
+            output.write(json.dumps(get_record(this_date, day)) + "\n")
 
-    holy_days: list[HolyDay] = []
-    this_date = start_date
-    while this_date <= end_date:
-        holy_days.extend(Lectionary(this_date).holy_days)
-        this_date += timedelta(days=1)
 
-    return holy_days
+def parse_date(text: str) -> date:
+    """Parse a date given as YYYY-MM-DD on the command line. Months and
+    days do not need leading zeros."""
+
+    try:
+        year, month, day = (int(x) for x in text.split("-"))
+        return date(year, month, day)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(
+            f"invalid date {text!r}, expected YYYY-MM-DD"
+        ) from exc
+
+
+def parse_args(args: list[str]) -> argparse.Namespace:
+    """Parse the command line arguments. When they do not begin with a
+    command, they are parsed as the arguments of the list command."""
+
+    if not args or args[0] not in COMMANDS and args[0] not in ("-h", "--help"):
+        args = ["list", *args]
+    return get_parser().parse_args(args)
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Get the parser for the command line arguments of the CLI tool."""
+
+    parser = argparse.ArgumentParser(
+        prog="pylect",
+        description=(
+            "Work with the holy days and lessons of the lectionary. When no"
+            " command is given, the list command is run."
+        ),
+    )
+    commands = parser.add_subparsers(
+        title="commands", dest="command", required=True
+    )
+
+    list_parser = commands.add_parser(
+        "list",
+        help="list the holy days between two dates (default)",
+        description="List the holy days in the lectionary between two dates.",
+    )
+    list_parser.add_argument(
+        "start_date",
+        type=parse_date,
+        nargs="?",
+        help="the first date to list, as YYYY-MM-DD (default: today)",
+    )
+    list_parser.add_argument(
+        "end_date",
+        type=parse_date,
+        nargs="?",
+        help="the last date to list (default: a week after the start date)",
+    )
+    list_parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help=(
+            "text lists the holy days and lets you copy their lessons; jsonl"
+            " and csv write one record per holy day for other programs, and"
+            " ics writes an iCalendar feed"
+        ),
+    )
+    list_parser.set_defaults(run=list_holy_days)
+
+    export_parser = commands.add_parser(
+        "export",
+        help="export the lessons for a range of dates as bulletins",
+        description="Export the lessons for a range of dates as bulletins.",
+    )
+    export_parser.add_argument(
+        "start_date", type=parse_date, help="the first date, as YYYY-MM-DD"
+    )
+    export_parser.add_argument(
+        "end_date", type=parse_date, help="the last date, as YYYY-MM-DD"
+    )
+    export_parser.add_argument(
+        "--out",
+        type=Path,
+        required=True,
+        help="the directory to write the bulletins to",
+    )
+    # The export formats are checked by export_bulletins, so that listing
+    # the holy days does not have to import the ESV client.
+    export_parser.add_argument(
+        "--format",
+        default="plain",
+        help="plain, markdown, or html (default: plain)",
+    )
+    export_parser.set_defaults(run=export)
+
+    return parser
 
 
 if __name__ == "__main__":
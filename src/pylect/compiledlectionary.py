@@ -0,0 +1,160 @@
+"""Provides the CompiledLectionary class, a flat table of the lessons in the
+lectionary, along with an on-disk cache of it so that the lectionary JSON
+only has to be parsed when it changes.
+
+The cache is written with marshal to the Pylect cache directory and is
+keyed by a hash of the JSON, so an edited or upgraded lectionary is
+compiled again automatically.
+"""
+
+import hashlib
+import json
+import marshal
+import os
+from collections.abc import Iterator
+from functools import cache
+from pathlib import Path
+
+from pylect.constants import DATA_DIR, get_cache_dir
+
+# Bump this whenever the layout of the compiled tables changes.
+FORMAT_VERSION = 2
+
+YEARS = ("Year A", "Year B", "Year C")
+YEAR_IDS = {year: i for i, year in enumerate(YEARS)}
+
+
+class CompiledLectionary:
+    """The CompiledLectionary class stores the lessons for every holy day
+    in a single tuple. Each day is given an id, and the lessons for a day,
+    service, and year are found at a fixed offset from the start of that
+    day's rows, so looking them up takes one dictionary lookup and one
+    index instead of walking the nested JSON.
+
+    Most days have a single service, which is recorded as None. Days like
+    Christmas Day have a row of years for each of their services. The
+    references for each lesson are stored as tuples.
+    """
+
+    def __init__(
+        self,
+        days: tuple[str, ...],
+        services: tuple[tuple[str | None, ...], ...],
+        offsets: tuple[int, ...],
+        table: tuple[dict | None, ...],
+    ) -> None:
+        self.days: tuple[str, ...] = days
+        self.services: tuple[tuple[str | None, ...], ...] = services
+        self.offsets: tuple[int, ...] = offsets
+        self.table: tuple[dict | None, ...] = table
+        self.day_ids: dict[str, int] = {day: i for i, day in enumerate(days)}
+
+    @classmethod
+    def from_lectionary(cls, lectionary: dict) -> "CompiledLectionary":
+        """Compile the nested lectionary loaded from JSON."""
+
+        services = []
+        offsets = []
+        table = []
+        for day in lectionary.values():
+            if all(key in YEAR_IDS for key in day):
+                services.append((None,))
+                groups = [day]
+            else:
+                services.append(tuple(day))
+                groups = list(day.values())
+
+            offsets.append(len(table))
+            for group in groups:
+                table.extend(_freeze(group.get(year)) for year in YEARS)
+
+        return cls(
+            tuple(lectionary), tuple(services), tuple(offsets), tuple(table)
+        )
+
+    def get_lessons(
+        self, name: str, year: str, service: str | None = None
+    ) -> dict | None:
+        """Get the lessons for a holy day in the given year. The service
+        must be given for days which have more than one.
+
+        Raises ValueError if there is no such day, year, or service.
+        """
+
+        try:
+            day_id = self.day_ids[name]
+            service_id = self.services[day_id].index(service)
+            year_id = YEAR_IDS[year]
+        except (KeyError, ValueError) as exc:
+            raise ValueError(
+                f"Error: no lessons for {name}, {year}, service {service}"
+            ) from exc
+
+        return self.table[
+            self.offsets[day_id] + service_id * len(YEARS) + year_id
+        ]
+
+    def iter_lessons(self) -> Iterator[tuple[str, str | None, str, dict]]:
+        """Yield (day name, service, year, lessons) for every row that has
+        lessons, in the order of the lectionary."""
+
+        for day_id, day in enumerate(self.days):
+            row = self.offsets[day_id]
+            for service in self.services[day_id]:
+                for year in YEARS:
+                    lessons = self.table[row]
+                    row += 1
+                    if lessons is not None:
+                        yield day, service, year, lessons
+
+    def to_tuple(self) -> tuple:
+        """Get the tables as a tuple that marshal can write."""
+
+        return (self.days, self.services, self.offsets, self.table)
+
+
+def _freeze(lessons: dict | None) -> dict | None:
+    # The lessons are shared by every caller, so each list of references is
+    # stored as a tuple that cannot be changed in place.
+    if lessons is None:
+        return None
+    return {lesson: tuple(refs) for lesson, refs in lessons.items()}
+
+
+def load_compiled_lectionary(
+    cache_path: Path, source: Path | None = None
+) -> CompiledLectionary:
+    """Load the compiled lectionary from cache_path if it was compiled from
+    the current source, or compile the source and save it there if not.
+    """
+
+    data = (source or DATA_DIR / "lectionary.json").read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+
+    try:
+        # Reading the whole file first is much faster than marshal.load,
+        # which reads from the file in small pieces.
+        version, cached_digest, tables = marshal.loads(cache_path.read_bytes())
+        if version == FORMAT_VERSION and cached_digest == digest:
+            return CompiledLectionary(*tables)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass  # missing, stale, or unreadable, so compile it again
+
+    compiled = CompiledLectionary.from_lectionary(json.loads(data))
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        temp_path.write_bytes(
+            marshal.dumps((FORMAT_VERSION, digest, compiled.to_tuple()))
+        )
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass  # the cache is only an optimization
+    return compiled
+
+
+@cache
+def get_compiled_lectionary() -> CompiledLectionary:
+    """Get the compiled lectionary shared by the whole process."""
+
+    return load_compiled_lectionary(get_cache_dir() / "lectionary.marshal")
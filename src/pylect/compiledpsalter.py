@@ -0,0 +1,200 @@
+"""Provides a compact binary format for the Psalter and the CompiledPsalms
+class for reading it. The text of every psalm is stored as a single UTF-8
+blob followed by tables of offsets into it, so the file can be memory-mapped
+and only the psalms that are actually requested are ever decoded.
+
+The header records a hash of the JSON the file was compiled from, so a
+Psalter compiled before the JSON was edited is not used by mistake.
+
+Run `python -m pylect.compiledpsalter` to compile `pylect/data/psalter.json`
+into `pylect/data/psalter.bin`.
+"""
+
+import hashlib
+import json
+import mmap
+import struct
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from pylect.constants import DATA_DIR
+
+MAGIC = b"PSALTER2"
+
+# magic, number of psalms, number of verses, SHA-256 of the source JSON
+HEADER = struct.Struct("<8sII32s")
+
+# The text fields of each psalm and verse, which are stored one after
+# another in the blob. The topics of a psalm are stored as JSON.
+PSALM_FIELDS = ("id", "latin_title", "topics")
+VERSE_FIELDS = (
+    "id",
+    "first_half",
+    "second_half",
+    "first_half_tle",
+    "second_half_tle",
+)
+
+# psalm number, start of each field, end of the last field, index of first
+# verse
+PSALM = struct.Struct("<I" + "I" * (len(PSALM_FIELDS) + 1) + "I")
+
+# verse number, start of each field, end of the last field, and flags with
+# one bit for each field that is missing (null in the JSON)
+VERSE = struct.Struct("<I" + "I" * (len(VERSE_FIELDS) + 1) + "B")
+
+
+def compile_psalter(source: Path, destination: Path) -> None:
+    """Compile the JSON Psalter at source into the binary format."""
+
+    data = source.read_bytes()
+    psalms = json.loads(data)
+
+    blob = bytearray()
+    psalm_table = bytearray()
+    verse_table = bytearray()
+    verse_count = 0
+
+    def append_fields(values: list[str | None]) -> tuple[list[int], int]:
+        offsets = [len(blob)]
+        flags = 0
+        for i, value in enumerate(values):
+            if value is None:
+                flags |= 1 << i
+            blob.extend((value or "").encode("utf-8"))
+            offsets.append(len(blob))
+        return offsets, flags
+
+    for psalm in psalms:
+        offsets, _ = append_fields(
+            [
+                psalm["id"],
+                psalm["latin_title"],
+                json.dumps(psalm["topics"], ensure_ascii=False),
+            ]
+        )
+        psalm_table += PSALM.pack(psalm["number"], *offsets, verse_count)
+        for verse in psalm["verses"]:
+            offsets, flags = append_fields(
+                [verse[field] for field in VERSE_FIELDS]
+            )
+            verse_table += VERSE.pack(verse["number"], *offsets, flags)
+            verse_count += 1
+
+    # A closing record marks where the verses of the last psalm end.
+    end = [len(blob)] * (len(PSALM_FIELDS) + 1)
+    psalm_table += PSALM.pack(0, *end, verse_count)
+
+    with open(destination, "wb") as f:
+        f.write(
+            HEADER.pack(
+                MAGIC, len(psalms), verse_count, hashlib.sha256(data).digest()
+            )
+        )
+        f.write(psalm_table)
+        f.write(verse_table)
+        f.write(blob)
+
+
+class CompiledPsalms(Sequence):
+    """The CompiledPsalms class memory-maps a compiled Psalter and behaves
+    like the list of psalms loaded from JSON: every psalm it returns is
+    equal to the same psalm in the JSON file it was compiled from. Each
+    psalm is decoded from the file only when it is requested.
+
+    If source is given, the file must have been compiled from it. Raises
+    ValueError if the file is not a compiled Psalter or is out of date.
+    """
+
+    def __init__(self, path: Path, source: Path | None = None) -> None:
+        with open(path, "rb") as f:
+            self.__data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, self.__psalm_count, verse_count, digest = (
+                HEADER.unpack_from(self.__data)
+            )
+        except struct.error as exc:
+            raise ValueError(
+                f"Error: {path} is not a compiled Psalter"
+            ) from exc
+        if magic != MAGIC:
+            raise ValueError(f"Error: {path} is not a compiled Psalter")
+        if (
+            source is not None
+            and hashlib.sha256(source.read_bytes()).digest() != digest
+        ):
+            raise ValueError(f"Error: {path} is out of date with {source}")
+
+        self.__psalm_offset = HEADER.size
+        self.__verse_offset = (
+            self.__psalm_offset + (self.__psalm_count + 1) * PSALM.size
+        )
+        self.__text_offset = self.__verse_offset + verse_count * VERSE.size
+
+    def __len__(self) -> int:
+        return self.__psalm_count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("psalm index out of range")
+
+        number, *offsets, first_verse = PSALM.unpack_from(
+            self.__data, self.__psalm_offset + index * PSALM.size
+        )
+        end_verse = PSALM.unpack_from(
+            self.__data, self.__psalm_offset + (index + 1) * PSALM.size
+        )[-1]
+
+        psalm_id, latin_title, topics = self.__get_fields(offsets, 0)
+        return {
+            "id": psalm_id,
+            "number": number,
+            "latin_title": latin_title,
+            "topics": json.loads(topics),
+            "verses": [
+                self.__get_verse(i) for i in range(first_verse, end_verse)
+            ],
+        }
+
+    def __get_verse(self, index: int) -> dict:
+        number, *offsets, flags = VERSE.unpack_from(
+            self.__data, self.__verse_offset + index * VERSE.size
+        )
+        verse = dict(zip(VERSE_FIELDS, self.__get_fields(offsets, flags)))
+        return {"id": verse.pop("id"), "number": number, **verse}
+
+    def __get_fields(self, offsets: list[int], flags: int) -> list[str | None]:
+        return [
+            None if flags & 1 << i else self.__get_text(start, end)
+            for i, (start, end) in enumerate(zip(offsets, offsets[1:]))
+        ]
+
+    def __get_text(self, start: int, end: int) -> str:
+        return self.__data[
+            self.__text_offset + start : self.__text_offset + end
+        ].decode("utf-8")
+
+
+def main() -> None:
+    """Compile the Psalter shipped with Pylect, or the JSON file given as
+    the first argument into the path given as the second.
+    """
+
+    source = (
+        Path(sys.argv[1]) if len(sys.argv) > 1 else DATA_DIR / "psalter.json"
+    )
+    destination = (
+        Path(sys.argv[2]) if len(sys.argv) > 2 else DATA_DIR / "psalter.bin"
+    )
+    compile_psalter(source, destination)
+    print(f"Compiled {source} to {destination}")
+
+
+if __name__ == "__main__":
+    main()
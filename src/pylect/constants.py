@@ -1,8 +1,12 @@
 """Defines global constants used throughout the rest of the program."""
 
 import json
+import os
 from enum import Enum
-from importlib.resources import files
+from functools import cache
+from pathlib import Path
+
+DATA_DIR = Path(__file__).parent / "data"
 
 
 class Rank(Enum):
@@ -15,7 +19,31 @@ class Rank(Enum):
     PRINCIPAL = 4
 
 
-LECTIONARY: dict
-lectionary_json = files("pylect.data").joinpath("lectionary.json")
-with open(lectionary_json, "r", encoding="utf-8") as f:
-    LECTIONARY = json.load(f)
+def get_cache_dir() -> Path:
+    """Get the directory where Pylect keeps its cached data. This can be
+    overridden with the PYLECT_CACHE_DIR environment variable.
+    """
+
+    if "PYLECT_CACHE_DIR" in os.environ:
+        return Path(os.environ["PYLECT_CACHE_DIR"])
+    if "XDG_CACHE_HOME" in os.environ:
+        return Path(os.environ["XDG_CACHE_HOME"]) / "pylect"
+    return Path.home() / ".cache" / "pylect"
+
+
+@cache
+def get_lectionary() -> dict:
+    """Get the lessons for every holy day, loading them on first use so
+    that importing Pylect does not have to parse the whole lectionary.
+    """
+
+    with open(DATA_DIR / "lectionary.json", "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def __getattr__(name: str):
+    # LECTIONARY is still available as a module attribute, but it is only
+    # loaded the first time it is accessed.
+    if name == "LECTIONARY":
+        return get_lectionary()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
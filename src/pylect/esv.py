@@ -2,48 +2,335 @@
 Scripture lessons provided by the lectionary.
 """
 
+import atexit
 import os
-import sys
+import random
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
-# The ESV API key is located in the .env file in the project's root directory.
-# This function from the dotenv module adds it as an environment variable that
-# we can reference below.
-load_dotenv()
-
-try:
-    API_KEY = os.environ["ESV_API_KEY"]
-except KeyError:
-    print("Error: missing ESV API key.")
-    print("Add `ESV_API_KEY=<your key goes here>` to your `.env` file.")
-    print("See README.md for more information.")
-    sys.exit(1)
+from pylect.circuitbreaker import CircuitBreaker
+from pylect.passagecache import PassageCache
+from pylect.ratelimiter import RateLimiter
 
 API_URL = "https://api.esv.org/v3/passage/text/"
 
+MAX_CONNECTIONS = 8
 
-def get_esv_text(query):
-    """Call the ESV API to get Scripture texts."""
-    params = {
-        "q": query,
-        "include-passage-references": True,
-        "include-verse-numbers": True,
-        "include-footnotes": False,
-        "include-footnotes-body": False,
-        "include-headings": False,
-        "include-short-copyright": False,
-        "indent-paragraphs": 0,
-        "indent-poetry": True,
-    }
-    headers = {"Authorization": f"Token {API_KEY}"}
-    response = requests.get(
-        API_URL, params=params, headers=headers, timeout=10
+MAX_BATCH_SIZE = 10
+
+# The published ESV API limits, as (requests, seconds) for each period.
+API_QUOTAS = {
+    "minute": (60, 60),
+    "hour": (1000, 60 * 60),
+    "day": (5000, 24 * 60 * 60),
+}
+
+MAX_THROTTLED_RETRIES = 3
+
+# Seconds to wait for a connection and for a response, respectively.
+API_TIMEOUT = (3.05, 10)
+
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5
+MAX_BACKOFF = 8.0
+
+# Cached passages older than this many seconds are still returned, but are
+# fetched again in the background to keep the cache fresh. The lectionary
+# repeats every three years, so a passage read once each cycle is only
+# refreshed after the cycle after that, and is kept until the one after.
+REVALIDATE_AFTER = 4 * 365 * 24 * 60 * 60
+CACHE_MAX_AGE = 5 * 365 * 24 * 60 * 60
+
+API_OPTIONS = {
+    "include-passage-references": True,
+    "include-verse-numbers": True,
+    "include-footnotes": False,
+    "include-footnotes-body": False,
+    "include-headings": False,
+    "include-short-copyright": False,
+    "indent-paragraphs": 0,
+    "indent-poetry": True,
+}
+
+
+class MissingApiKeyError(ValueError):
+    """Raised when a passage has to be fetched but no ESV API key is set."""
+
+
+@cache
+def get_api_key() -> str:
+    """Get the ESV API key. It is only looked up the first time a passage
+    has to be fetched, so commands that never call the API do not need it.
+
+    Raises MissingApiKeyError if the key is not set.
+    """
+
+    # The ESV API key is located in the .env file in the project's root
+    # directory. This function from the dotenv module adds it as an
+    # environment variable that we can reference below.
+    load_dotenv()
+
+    try:
+        return os.environ["ESV_API_KEY"]
+    except KeyError as exc:
+        raise MissingApiKeyError(
+            "Error: missing ESV API key.\n"
+            "Add `ESV_API_KEY=<your key goes here>` to your `.env` file.\n"
+            "See README.md for more information."
+        ) from exc
+
+
+@cache
+def get_passage_cache() -> PassageCache | None:
+    """Get the on-disk cache shared by every ESV request, or None if the
+    cache directory cannot be used, in which case passages are always
+    fetched from the API.
+    """
+
+    try:
+        passage_cache = PassageCache(max_age=CACHE_MAX_AGE)
+    except (OSError, sqlite3.Error):
+        return None  # the cache is only an optimization
+    atexit.register(_flush_passage_cache, passage_cache)
+    return passage_cache
+
+
+def _flush_passage_cache(passage_cache: PassageCache) -> None:
+    try:
+        passage_cache.flush()
+    except sqlite3.Error:
+        pass  # only the least recently used order is lost
+
+
+@cache
+def get_rate_limiter() -> RateLimiter:
+    """Get the rate limiter shared by every ESV request. Its remaining()
+    method reports how much of each quota is left.
+    """
+
+    return RateLimiter(API_QUOTAS)
+
+
+@cache
+def get_circuit_breaker() -> CircuitBreaker:
+    """Get the circuit breaker shared by every ESV request, which stops
+    requests from waiting on the API after it has failed repeatedly.
+    """
+
+    return CircuitBreaker()
+
+
+@cache
+def get_revalidator() -> ThreadPoolExecutor:
+    """Get the single background worker which refreshes stale passages, so
+    that refreshing never competes with the requests a caller is waiting
+    on. Refreshes still queued when the program ends are finished first.
+    """
+
+    return ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="pylect-revalidate"
     )
-    passages = response.json()["passages"]
+
+
+@cache
+def get_session() -> requests.Session:
+    """Get the HTTP session shared by every ESV request, so connections to
+    the API are kept alive and reused instead of opened for each passage.
+    """
+
+    session = requests.Session()
+    session.headers["Authorization"] = f"Token {get_api_key()}"
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CONNECTIONS)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_esv_texts(queries: list[str]) -> list[str]:
+    """Get the texts of several Scripture passages at once, returned in the
+    same order as the queries.
+
+    Duplicate queries are fetched only once, and cached passages are not
+    fetched at all. The API returns one passage for each reference in a
+    semicolon-separated query, so the remaining references are packed into
+    as few requests as possible and the requests are sent concurrently.
+    """
+
+    texts = _get_cached_texts(queries)
+    missing = [query for query in dict.fromkeys(queries) if query not in texts]
+
+    batches = _get_batches(missing)
+    if len(batches) == 1:
+        texts.update(_fetch_batch(batches[0]))
+    elif batches:
+        workers = min(len(batches), MAX_CONNECTIONS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for batch_texts in executor.map(_fetch_batch, batches):
+                texts.update(batch_texts)
+
+    return [texts[query] for query in queries]
+
+
+def get_esv_text(query):
+    """Call the ESV API to get Scripture texts. Passages that have been
+    fetched before are read from the on-disk cache instead.
+    """
+    text = _get_cached_text(query)
+    if text is not None:
+        return text
+    return _fetch_text(query)
+
+
+_revalidating: set[str] = set()
+_revalidating_lock = threading.Lock()
+
+
+def _get_cached_text(query: str) -> str | None:
+    return _get_cached_texts([query]).get(query)
+
+
+def _get_cached_texts(queries: list[str]) -> dict[str, str]:
+    passage_cache = get_passage_cache()
+    if passage_cache is None:
+        return {}
+    try:
+        entries = passage_cache.get_many(queries, API_OPTIONS)
+    except (OSError, sqlite3.Error):
+        return {}
+
+    texts: dict[str, str] = {}
+    stale: list[str] = []
+    with _revalidating_lock:
+        for query, (text, age) in entries.items():
+            texts[query] = text
+            if age > REVALIDATE_AFTER and query not in _revalidating:
+                _revalidating.add(query)
+                stale.append(query)
+    if stale:
+        get_revalidator().submit(_revalidate, stale)
+    return texts
+
+
+def _set_cached_text(query: str, text: str) -> None:
+    passage_cache = get_passage_cache()
+    if passage_cache is None:
+        return
+    try:
+        passage_cache.set(query, API_OPTIONS, text)
+    except (OSError, sqlite3.Error):
+        pass  # the cache is only an optimization
+
+
+def _revalidate(queries: list[str]) -> None:
+    try:
+        for batch in _get_batches(queries):
+            try:
+                _fetch_batch(batch)
+            except ValueError:
+                pass  # keep serving the cached copies
+    finally:
+        with _revalidating_lock:
+            _revalidating.difference_update(queries)
+
+
+def _get_batches(queries: list[str]) -> list[list[str]]:
+    # A reference with several ranges, such as "Luke 2:1-14, (15-20)", may
+    # come back as more than one passage, so it is sent on its own.
+    single = [q for q in queries if "," not in q and ";" not in q]
+    multiple = [q for q in queries if "," in q or ";" in q]
+
+    batches = [
+        single[i : i + MAX_BATCH_SIZE]
+        for i in range(0, len(single), MAX_BATCH_SIZE)
+    ]
+    batches.extend([query] for query in multiple)
+    return batches
+
+
+def _fetch_batch(batch: list[str]) -> dict[str, str]:
+    if len(batch) > 1:
+        passages = _fetch_passages("; ".join(batch))
+        # If any reference was not found, the passages can no longer be
+        # matched up with the queries, so fall back to one at a time.
+        if len(passages) == len(batch):
+            texts: dict[str, str] = {}
+            for query, passage in zip(batch, passages):
+                texts[query] = _format_passages([passage])
+                _set_cached_text(query, texts[query])
+            return texts
+
+    return {query: _fetch_text(query) for query in batch}
+
+
+def _fetch_text(query: str) -> str:
+    passages = _fetch_passages(query)
     if passages:
-        text = "\n".join([passage.strip() for passage in passages])
-        text = text.replace("[", "").replace("]", "")
+        text = _format_passages(passages)
+        _set_cached_text(query, text)
         return text
     raise ValueError("Error: passage not found")
+
+
+def _fetch_passages(query: str) -> list[str]:
+    response = _request({"q": query, **API_OPTIONS})
+    data = response.json()
+    if "passages" not in data:
+        raise ValueError(f"Error: {data.get("detail", "request failed")}")
+    return data["passages"]
+
+
+def _request(params: dict) -> requests.Response:
+    circuit_breaker = get_circuit_breaker()
+    rate_limiter = get_rate_limiter()
+    attempts = 0
+    throttled = 0
+    while True:
+        if not circuit_breaker.allow():
+            raise ValueError("Error: the ESV API is unavailable")
+
+        rate_limiter.acquire()
+        try:
+            response = get_session().get(
+                API_URL, params=params, timeout=API_TIMEOUT
+            )
+        except requests.RequestException:
+            response = None
+
+        if response is not None and response.status_code < 500:
+            if (
+                response.status_code == 429
+                and throttled < MAX_THROTTLED_RETRIES
+            ):
+                throttled += 1
+                rate_limiter.pause(_get_retry_after(response))
+                continue
+            circuit_breaker.record_success()
+            return response
+
+        # Connection errors, timeouts, and server errors are retried after
+        # an exponentially growing, randomly jittered delay.
+        circuit_breaker.record_failure()
+        if attempts == MAX_RETRIES:
+            raise ValueError("Error: could not reach the ESV API")
+        time.sleep(
+            random.uniform(0, min(MAX_BACKOFF, BACKOFF_BASE * 2**attempts))
+        )
+        attempts += 1
+
+
+def _get_retry_after(response: requests.Response) -> float:
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return 60.0
+
+
+def _format_passages(passages: list[str]) -> str:
+    text = "\n".join([passage.strip() for passage in passages])
+    return text.replace("[", "").replace("]", "")
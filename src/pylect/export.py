@@ -0,0 +1,161 @@
+"""Provides functions for exporting the lessons of every holy day in a range
+of dates as bulletin documents, one file for each holy day. The texts of
+all the lessons are fetched together before any documents are written, so
+an export makes as few requests to the ESV API as possible and reads
+everything else from the cache.
+"""
+
+from collections.abc import Callable, Iterator
+from datetime import date
+from html import escape
+from pathlib import Path
+
+from pylect.esv import get_esv_texts
+from pylect.holyday import HolyDay
+from pylect.lectionary import iter_holy_days
+from pylect.psalter import get_psalter
+
+# The heading and text of each lesson in a bulletin. The texts of the
+# lessons begin with their reference.
+Section = tuple[str, str]
+
+DocumentRenderer = Callable[[date, HolyDay, list[Section]], str]
+
+
+def render_plain(
+    this_date: date, day: HolyDay, sections: list[Section]
+) -> str:
+    """Render a bulletin as plain text."""
+
+    text_list = [day.name, _format_date(this_date)]
+    for heading, text in sections:
+        text_list.append(f"{heading}\n\n{text}")
+    return "\n\n".join(text_list) + "\n"
+
+
+def render_markdown(
+    this_date: date, day: HolyDay, sections: list[Section]
+) -> str:
+    """Render a bulletin as Markdown. Line breaks within the lessons are
+    kept, so poetry is laid out as it is in the ESV."""
+
+    text_list = [f"# {day.name}", f"*{_format_date(this_date)}*"]
+    for heading, text in sections:
+        text_list.append(f"## {heading}")
+        if heading == "Psalm":
+            text_list.append(text)
+        else:
+            text_list.append(_get_markdown_paragraphs(text))
+    return "\n\n".join(text_list) + "\n"
+
+
+def render_html(this_date: date, day: HolyDay, sections: list[Section]) -> str:
+    """Render a bulletin as a standalone HTML document."""
+
+    text_list = [
+        "<!DOCTYPE html>",
+        '<html lang="en">',
+        "<head>",
+        '<meta charset="utf-8">',
+        f"<title>{escape(day.name)}</title>",
+        "</head>",
+        "<body>",
+        f"<h1>{escape(day.name)}</h1>",
+        f'<p class="date">{_format_date(this_date)}</p>',
+    ]
+    for heading, text in sections:
+        text_list.append('<section class="lesson">')
+        text_list.append(f"<h2>{escape(heading)}</h2>")
+        if heading == "Psalm":
+            text_list.append(text)
+        else:
+            text_list.extend(_get_html_paragraphs(text))
+        text_list.append("</section>")
+    text_list.extend(["</body>", "</html>"])
+    return "\n".join(text_list) + "\n"
+
+
+# Maps each export format to its file extension and renderer. The psalms are
+# rendered with the psalm format of the same name.
+EXPORT_FORMATS: dict[str, tuple[str, DocumentRenderer]] = {
+    "plain": (".txt", render_plain),
+    "markdown": (".md", render_markdown),
+    "html": (".html", render_html),
+}
+
+
+def export_bulletins(
+    start_date: date, end_date: date, out_dir: Path, fmt: str = "plain"
+) -> list[Path]:
+    """Write a bulletin for every holy day between the start and end dates
+    (inclusive) to out_dir, and return the paths of the files written.
+
+    The first of any alternative lessons is used, as in the interactive
+    CLI. Raises ValueError for an unknown format or if any of the lessons
+    cannot be fetched, in which case no files are written.
+    """
+
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Error: unknown export format {fmt!r}")
+    extension, render = EXPORT_FORMATS[fmt]
+
+    days = list(iter_holy_days(start_date, end_date))
+    texts = _get_texts(days, fmt)
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths: list[Path] = []
+    for this_date, day in days:
+        sections = [
+            (heading, texts[references[0]])
+            for heading, references in day.lessons.items()
+        ]
+        path = out_dir / (f"{this_date.isoformat()}-{day.slug}{extension}")
+        path.write_text(render(this_date, day, sections), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _get_texts(days: list[tuple[date, HolyDay]], fmt: str) -> dict[str, str]:
+    psalms: list[str] = []
+    lessons: list[str] = []
+    for _, day in days:
+        for heading, references in day.lessons.items():
+            if heading == "Psalm":
+                psalms.append(references[0])
+            else:
+                lessons.append(references[0])
+
+    psalms = list(dict.fromkeys(psalms))
+    lessons = list(dict.fromkeys(lessons))
+    texts = dict(zip(psalms, get_psalter().get_psalms(psalms, fmt)))
+    texts.update(zip(lessons, get_esv_texts(lessons)))
+    return texts
+
+
+def _format_date(this_date: date) -> str:
+    return f"{this_date:%A, %B} {this_date.day}, {this_date.year}"
+
+
+def _iter_paragraphs(text: str) -> Iterator[list[str]]:
+    paragraph: list[str] = []
+    for line in text.splitlines():
+        if line.strip():
+            paragraph.append(line.strip())
+        elif paragraph:
+            yield paragraph
+            paragraph = []
+    if paragraph:
+        yield paragraph
+
+
+def _get_markdown_paragraphs(text: str) -> str:
+    return "\n\n".join(
+        "  \n".join(paragraph) for paragraph in _iter_paragraphs(text)
+    )
+
+
+def _get_html_paragraphs(text: str) -> list[str]:
+    return [
+        f"<p>{"<br>\n".join(escape(line) for line in paragraph)}</p>"
+        for paragraph in _iter_paragraphs(text)
+    ]
@@ -0,0 +1,126 @@
+"""Provides functions for generating the liturgical calendar over a long
+range of years. Every calendar year can be resolved independently of the
+others, so the years are shared out across a pool of worker processes and
+the results are written to the output file in order as they arrive.
+
+Run `python -m pylect.generate <start_year> <end_year> <output_file>` to
+write one line for every date in the range, giving the date, lectionary
+year, season, observed holy day, and every holy day falling on that date,
+separated by tabs.
+"""
+
+import argparse
+import os
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from timeit import default_timer as timer
+from typing import TextIO
+
+from pylect.liturgicalyear import LiturgicalYear
+
+HEADER = "date\tyear\tseason\tobserved\tholy_days\n"
+
+
+def generate_year(year: int) -> str:
+    """Generate the lines of the calendar for a single year."""
+
+    liturgical_year = LiturgicalYear(year)
+    lines = []
+    this_date = date(year, 1, 1)
+    for i in range(liturgical_year.length):
+        observed = liturgical_year.observed[i]
+        holy_days = "; ".join(day.name for day in liturgical_year.holy_days[i])
+        lines.append(
+            f"{this_date.isoformat()}\t"
+            f"{liturgical_year.liturgical_years[i]}\t"
+            f"{liturgical_year.liturgical_seasons[i]}\t"
+            f"{observed.name if observed else ""}\t"
+            f"{holy_days}\n"
+        )
+        this_date += timedelta(days=1)
+    return "".join(lines)
+
+
+def iter_years(
+    start_year: int, end_year: int, workers: int | None = None
+) -> Iterator[str]:
+    """Yield the calendar for each year between the start and end years
+    (inclusive), in order. The years are generated by a pool of worker
+    processes, using one for each CPU unless workers is given.
+    """
+
+    years = range(start_year, end_year + 1)
+    workers = min(workers or os.cpu_count() or 1, len(years))
+    if workers <= 1:
+        yield from map(generate_year, years)
+        return
+
+    # A few years per task keeps the workers busy without holding many
+    # finished years in memory while waiting for an earlier one.
+    chunksize = max(1, min(8, len(years) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(generate_year, years, chunksize=chunksize)
+
+
+def generate(
+    start_year: int,
+    end_year: int,
+    output: TextIO,
+    workers: int | None = None,
+) -> int:
+    """Write the calendar for every date between the start and end years
+    (inclusive) to output, and return the number of dates written.
+    """
+
+    output.write(HEADER)
+    days = 0
+    for text in iter_years(start_year, end_year, workers):
+        output.write(text)
+        days += text.count("\n")
+    return days
+
+
+def main() -> None:
+    """Generate the calendar for the years given on the command line and
+    report how quickly it was generated."""
+
+    parser = argparse.ArgumentParser(
+        prog="python -m pylect.generate",
+        description="Generate the liturgical calendar for a range of years.",
+    )
+    parser.add_argument("start_year", type=int)
+    parser.add_argument("end_year", type=int)
+    parser.add_argument("output", help="the file to write, or - for stdout")
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes (default: one per CPU)",
+    )
+    args = parser.parse_args()
+    if args.end_year < args.start_year:
+        parser.error("end_year must not be before start_year")
+
+    start = timer()
+    if args.output == "-":
+        days = generate(
+            args.start_year, args.end_year, sys.stdout, args.workers
+        )
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            days = generate(args.start_year, args.end_year, f, args.workers)
+    elapsed = timer() - start
+
+    years = args.end_year - args.start_year + 1
+    print(
+        f"Generated {years} years ({days} days) in {elapsed:.2f}s:"
+        f" {days / elapsed:,.0f} days/s",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
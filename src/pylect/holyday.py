@@ -1,33 +1,95 @@
 """Provides access to the HolyDay class."""
 
-from pylect.constants import LECTIONARY, Rank
+import re
+import threading
+from types import MappingProxyType
+
+from pylect.compiledlectionary import get_compiled_lectionary
+from pylect.constants import Rank
+
+# The service whose lessons are used for holy days with more than one.
+PRINCIPAL_SERVICES = {
+    "Christmas Day": "I",
+    "Easter Day": "Principal Service",
+}
 
 
 class HolyDay:
     """The HolyDay class is data structure that contains all the relevant
     information for any given Sunday, Holy Day, or Commemoration found
-    in the lectionary."""
+    in the lectionary.
 
-    def __init__(self, name: str, year: str, season: str, rank: Rank):
-        self.name: str = name
-        self.year: str = year
-        self.season: str = season
-        self.rank: Rank = rank
-        self.collect: str = self.__get_collect()
-        self.lessons: dict = self.__get_lessons()
+    HolyDay objects are immutable and interned, so creating a holy day
+    with the same name, year, season, and rank as an existing one returns
+    the existing object. A calendar covering any number of years therefore
+    only ever holds a few hundred of them.
+    """
 
-    def __get_collect(self) -> str:
-        pass
+    __slots__ = ("name", "year", "season", "rank", "collect", "_lessons")
+
+    __instances: dict[tuple[str, str, str, Rank], "HolyDay"] = {}
+    __instances_lock = threading.Lock()
+
+    name: str
+    year: str
+    season: str
+    rank: Rank
+    collect: str
+    _lessons: MappingProxyType | None
+
+    def __new__(cls, name: str, year: str, season: str, rank: Rank):
+        key = (name, year, season, rank)
+        instance = cls.__instances.get(key)
+        if instance is not None:
+            return instance
+
+        with cls.__instances_lock:
+            instance = cls.__instances.get(key)
+            if instance is None:
+                instance = super().__new__(cls)
+                for attr, value in zip(cls.__slots__, key):
+                    object.__setattr__(instance, attr, value)
+                object.__setattr__(
+                    instance, "collect", cls.__get_collect(instance)
+                )
+                object.__setattr__(instance, "_lessons", None)
+                cls.__instances[key] = instance
+        return instance
 
-    def __get_lessons(self) -> dict:
-        if self.name == "Christmas Day":
-            return (LECTIONARY.get(self.name).get("I").get(self.year),)
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} objects are immutable")
 
-        if self.name == "Easter Day":
-            return (
-                LECTIONARY.get(self.name)
-                .get("Principal Service")
-                .get(self.year),
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} objects are immutable")
+
+    def __reduce__(self):
+        # Unpickled holy days are interned in the receiving process too.
+        return (type(self), (self.name, self.year, self.season, self.rank))
+
+    def __repr__(self) -> str:
+        return (
+            f"HolyDay({self.name!r}, {self.year!r}, {self.season!r},"
+            f" {self.rank})"
+        )
+
+    @property
+    def slug(self) -> str:
+        """The name in lowercase with hyphens between words, for use in file
+        names and identifiers."""
+
+        return re.sub(r"[^a-z0-9]+", "-", self.name.lower()).strip("-")
+
+    @property
+    def lessons(self) -> MappingProxyType:
+        """The lessons appointed for this day, which are looked up in the
+        lectionary the first time they are needed."""
+
+        if self._lessons is None:
+            lessons = get_compiled_lectionary().get_lessons(
+                self.name, self.year, PRINCIPAL_SERVICES.get(self.name)
             )
+            object.__setattr__(self, "_lessons", MappingProxyType(lessons))
+        return self._lessons
 
-        return LECTIONARY.get(self.name).get(self.year)
+    def __get_collect(self) -> str:
+        pass
@@ -0,0 +1,156 @@
+"""Provides functions for writing the holy days in a range of dates as an
+iCalendar (RFC 5545) feed. Each holy day becomes an all-day event with its
+lessons in the description.
+
+Events are written one at a time as the holy days are found, so a feed
+covering any number of years is written in constant memory. The UID of
+every event depends only on its date and holy day, and its DTSTAMP and
+LAST-MODIFIED only on its own content, so regenerating a feed leaves
+unchanged events exactly as they were, on any machine, while an event whose
+lessons change gets a new stamp and is updated by calendar clients.
+"""
+
+import hashlib
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, timedelta, timezone
+from typing import TextIO
+
+from pylect.holyday import HolyDay
+
+PRODID = "-//Pylect//Anglican Lectionary//EN"
+
+UID_DOMAIN = "pylect"
+
+# Lines longer than this many octets must be folded (RFC 5545, 3.1).
+MAX_LINE_OCTETS = 75
+
+# The stamp of each event is a time between these two dates picked by a
+# hash of the event's content. It is not the time the event was revised,
+# which Pylect has no record of, but it is always in the past and changes
+# whenever the content does.
+STAMP_START = datetime(2000, 1, 1, tzinfo=timezone.utc)
+STAMP_END = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def iter_ics_lines(
+    holy_days: Iterable[tuple[date, HolyDay]], name: str | None = None
+) -> Iterator[str]:
+    """Yield the lines of an iCalendar feed containing one event for each
+    (date, HolyDay) pair, already folded and ending in CRLF. The name, if
+    given, is shown by calendar clients as the name of the calendar.
+    """
+
+    yield from _fold("BEGIN:VCALENDAR")
+    yield from _fold("VERSION:2.0")
+    yield from _fold(f"PRODID:{PRODID}")
+    yield from _fold("CALSCALE:GREGORIAN")
+    if name is not None:
+        yield from _fold(f"X-WR-CALNAME:{_escape(name)}")
+
+    for this_date, day in holy_days:
+        for line in get_event(this_date, day):
+            yield from _fold(line)
+
+    yield from _fold("END:VCALENDAR")
+
+
+def write_ics(
+    holy_days: Iterable[tuple[date, HolyDay]],
+    output: TextIO,
+    name: str | None = None,
+) -> None:
+    """Write an iCalendar feed of the holy days to output, one event at a
+    time. The output should be opened with newline="" so that the CRLF line
+    endings required by RFC 5545 are written unchanged."""
+
+    for line in iter_ics_lines(holy_days, name):
+        output.write(line)
+
+
+def get_event(this_date: date, day: HolyDay) -> list[str]:
+    """Get the unfolded content lines of the event for a holy day."""
+
+    day_stamp = f"{this_date:%Y%m%d}"
+    content = [
+        f"DTSTART;VALUE=DATE:{day_stamp}",
+        f"DTEND;VALUE=DATE:{this_date + timedelta(days=1):%Y%m%d}",
+        f"SUMMARY:{_escape(day.name)}",
+        f"DESCRIPTION:{_escape(get_description(day))}",
+        f"CATEGORIES:{_escape(day.season)}",
+        "TRANSP:TRANSPARENT",
+    ]
+    stamp = get_stamp(content)
+    return [
+        "BEGIN:VEVENT",
+        f"UID:{get_uid(this_date, day)}",
+        f"DTSTAMP:{stamp}",
+        f"LAST-MODIFIED:{stamp}",
+        *content,
+        "END:VEVENT",
+    ]
+
+
+def get_uid(this_date: date, day: HolyDay) -> str:
+    """Get the UID of the event for a holy day, which stays the same each
+    time the feed is generated."""
+
+    return f"{this_date:%Y%m%d}-{day.slug}@{UID_DOMAIN}"
+
+
+def get_stamp(content: list[str]) -> str:
+    """Get the DTSTAMP for an event with the given content lines, which is
+    the same every time the same content is stamped."""
+
+    digest = hashlib.sha256("\n".join(content).encode("utf-8")).digest()
+    seconds = int((STAMP_END - STAMP_START).total_seconds())
+    stamp = STAMP_START + timedelta(
+        seconds=int.from_bytes(digest[:8]) % seconds
+    )
+    return f"{stamp:%Y%m%dT%H%M%SZ}"
+
+
+def get_description(day: HolyDay) -> str:
+    """Describe the lectionary year and season of a holy day along with
+    its lessons, giving any alternative lessons after "or"."""
+
+    lines = [f"{day.season}, {day.year}", ""]
+    for heading, references in day.lessons.items():
+        lines.append(f"{heading}: {" or ".join(references)}")
+    return "\n".join(lines)
+
+
+def _escape(text: str) -> str:
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> Iterator[str]:
+    octets = len(line.encode("utf-8"))
+    if octets <= MAX_LINE_OCTETS:
+        yield line + "\r\n"
+        return
+
+    # Continuation lines begin with a space, which counts toward their
+    # length. ASCII lines can be sliced directly, but otherwise a line must
+    # never be split in the middle of a UTF-8 sequence.
+    if octets == len(line):
+        yield line[:MAX_LINE_OCTETS] + "\r\n"
+        for i in range(MAX_LINE_OCTETS, len(line), MAX_LINE_OCTETS - 1):
+            yield " " + line[i : i + MAX_LINE_OCTETS - 1] + "\r\n"
+        return
+
+    part = ""
+    size = 0
+    for char in line:
+        char_size = len(char.encode("utf-8"))
+        if size + char_size > MAX_LINE_OCTETS:
+            yield part + "\r\n"
+            part = " "
+            size = 1
+        part += char
+        size += char_size
+    yield part + "\r\n"
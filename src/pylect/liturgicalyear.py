@@ -0,0 +1,151 @@
+"""Provides access to the LiturgicalYear class."""
+
+from collections import deque
+from datetime import date
+from functools import lru_cache
+
+from pylect.constants import Rank
+from pylect.holyday import HolyDay
+from pylect.observances import (
+    ADVENT_SEASON,
+    CALENDAR,
+    SEASONS,
+    Calendar,
+    YearAnchors,
+    get_year_anchors,
+)
+
+
+class LiturgicalYear:
+    """The LiturgicalYear class resolves every date in a single calendar
+    year at once. The moveable dates are calculated only one time, and each
+    holy day is placed directly onto a day-of-year table, so looking up the
+    holy days, season, or lectionary year for any date is a simple index.
+
+    The results are identical to creating a new Lectionary object for each
+    date in the year.
+
+    The observed table resolves dates on which more than one holy day falls.
+    The holy day with the highest rank is observed, and any displaced Major
+    Feast is transferred to the next day on which no other holy day falls.
+    Displaced Sundays are not transferred.
+
+    The holy days are placed by the rules of the given calendar, which is
+    the calendar of the lectionary unless another is given.
+    """
+
+    def __init__(self, year: int, calendar: Calendar = CALENDAR) -> None:
+        self.year: int = year
+        self.calendar: Calendar = calendar
+        self.year_anchors: YearAnchors = get_year_anchors(year)
+        self.moveable_dates: dict[str, date] = dict(
+            self.year_anchors.moveable_dates
+        )
+        self.first_day: date = date(year, 1, 1)
+        self.length: int = (date(year + 1, 1, 1) - self.first_day).days
+        self.liturgical_years: list[str] = self.__get_liturgical_years()
+        self.liturgical_seasons: list[str] = self.__get_liturgical_seasons()
+        self.holy_days: list[list[HolyDay]] = self.__get_holy_days()
+        self.observed: list[HolyDay | None] = self.__get_observed()
+
+    def get_holy_days(self, this_date: date) -> list[HolyDay]:
+        """Get the holy days which fall on the given date."""
+
+        return self.holy_days[self.__get_index(this_date)]
+
+    def get_liturgical_year(self, this_date: date) -> str:
+        """Get the lectionary year (A, B, or C) for the given date."""
+
+        return self.liturgical_years[self.__get_index(this_date)]
+
+    def get_liturgical_season(self, this_date: date) -> str:
+        """Get the liturgical season for the given date."""
+
+        return self.liturgical_seasons[self.__get_index(this_date)]
+
+    def get_observed(self, this_date: date) -> HolyDay | None:
+        """Get the holy day observed on the given date after precedence and
+        transfers have been applied, if any.
+        """
+
+        return self.observed[self.__get_index(this_date)]
+
+    def __get_index(self, this_date: date) -> int:
+        if this_date.year != self.year:
+            raise ValueError(f"Error: {this_date} is not in {self.year}")
+        return (this_date - self.first_day).days
+
+    def __get_liturgical_years(self) -> list[str]:
+        advent_index = (
+            self.year_anchors.season_starts[ADVENT_SEASON - 1]
+            - self.first_day.toordinal()
+        )
+        before_advent = f"Year {"ABC"[(self.year - 1) % 3]}"
+        after_advent = f"Year {"ABC"[self.year % 3]}"
+        return [before_advent] * advent_index + [after_advent] * (
+            self.length - advent_index
+        )
+
+    def __get_liturgical_seasons(self) -> list[str]:
+        first_day = self.first_day.toordinal()
+        ends = [*self.year_anchors.season_starts, first_day + self.length]
+
+        seasons: list[str] = []
+        for season, end in zip(SEASONS, ends):
+            seasons.extend([season] * (end - first_day - len(seasons)))
+        return seasons
+
+    def __get_holy_days(self) -> list[list[HolyDay]]:
+        holy_days: list[list[HolyDay]] = [[] for _ in range(self.length)]
+        for rule in self.calendar.rules:
+            this_date = self.calendar.get_date(
+                rule, self.year, self.year_anchors.anchors
+            )
+            if this_date is not None:
+                self.__place(holy_days, this_date, rule.name, rule.rank)
+        return holy_days
+
+    def __get_observed(self) -> list[HolyDay | None]:
+        observed: list[HolyDay | None] = []
+        transfers: deque[HolyDay] = deque()
+        for holy_days in self.holy_days:
+            if not holy_days:
+                observed.append(transfers.popleft() if transfers else None)
+                continue
+
+            # Ties in rank go to whichever holy day is listed first.
+            primary = max(holy_days, key=lambda d: d.rank.value)
+            observed.append(primary)
+            transfers.extend(
+                d
+                for d in holy_days
+                if d is not primary and d.rank == Rank.MAJOR
+            )
+        return observed
+
+    def __place(
+        self,
+        holy_days: list[list[HolyDay]],
+        this_date: date,
+        day_name: str,
+        rank: Rank,
+    ) -> None:
+        index = (this_date - self.first_day).days
+        holy_days[index].append(
+            HolyDay(
+                day_name,
+                self.liturgical_years[index],
+                self.liturgical_seasons[index],
+                rank,
+            )
+        )
+
+
+@lru_cache(maxsize=16)
+def get_liturgical_year(year: int) -> LiturgicalYear:
+    """Get the LiturgicalYear for a calendar year, resolving it only the
+    first time it is requested. Only the most recently used years are kept
+    so that long-running iteration does not grow without bound.
+    """
+
+    return LiturgicalYear(year)
@@ -0,0 +1,461 @@
+"""Defines the rules that place every Sunday and Holy Day of the lectionary
+in a given calendar year. The rules are plain data: a holy day either falls
+on a fixed month and day, or a number of days from one of the year's anchor
+dates, such as Easter Day or the First Sunday of Advent. They are compiled
+into a Calendar, which can find the holy days on a date or the dates of a
+holy day without scanning through the calendar one day at a time.
+"""
+
+from bisect import bisect_right
+from collections.abc import Iterable
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import NamedTuple
+
+from dateutil.easter import easter
+from dateutil.relativedelta import SU, relativedelta
+
+from pylect.constants import Rank
+
+PRINCIPAL_FEASTS_FROM_EASTER: tuple[tuple[str, int], ...] = (
+    ("Easter Day", 0),
+    ("Ascension Day", 39),
+    ("Day of Pentecost", 49),
+    ("Trinity Sunday", 56),
+)
+
+PRINCIPAL_FEASTS_FIXED: tuple[tuple[str, int, int], ...] = (
+    ("Christmas Day", 12, 25),
+    ("The Epiphany", 1, 6),
+    ("All Saints' Day", 11, 1),
+)
+
+HOLY_WEEK: tuple[str, ...] = (
+    "Palm Sunday",
+    "Monday in Holy Week",
+    "Tuesday in Holy Week",
+    "Wednesday in Holy Week",
+    "Maundy Thursday",
+    "Good Friday",
+    "Holy Saturday",
+)
+
+EASTER_WEEK: tuple[str, ...] = (
+    "Monday in Easter Week",
+    "Tuesday in Easter Week",
+    "Wednesday in Easter Week",
+    "Thursday in Easter Week",
+    "Friday in Easter Week",
+    "Saturday in Easter Week",
+)
+
+ADVENT_SUNDAYS: tuple[str, ...] = (
+    "First Sunday of Advent",
+    "Second Sunday of Advent",
+    "Third Sunday of Advent",
+    "Fourth Sunday of Advent",
+)
+
+EPIPHANY_SUNDAYS: tuple[str, ...] = (
+    "First Sunday after Epiphany",
+    "Second Sunday after Epiphany",
+    "Third Sunday after Epiphany",
+    "Fourth Sunday after Epiphany",
+    "Fifth Sunday after Epiphany",
+    "Sixth Sunday after Epiphany",
+    "Seventh Sunday after Epiphany",
+    "Eighth Sunday after Epiphany",
+)
+
+LENT_SUNDAYS: tuple[str, ...] = (
+    "First Sunday in Lent",
+    "Second Sunday in Lent",
+    "Third Sunday in Lent",
+    "Fourth Sunday in Lent",
+    "Fifth Sunday in Lent",
+)
+
+EASTER_SUNDAYS: tuple[str, ...] = (
+    "Second Sunday of Easter",
+    "Third Sunday of Easter",
+    "Fourth Sunday of Easter",
+    "Fifth Sunday of Easter",
+    "Sixth Sunday of Easter",
+    "Sunday after Ascension Day",
+)
+
+PROPERS: tuple[str, ...] = tuple(f"Proper {n}" for n in range(1, 30))
+
+RED_LETTER_DAYS: tuple[tuple[str, int, int], ...] = (
+    ("Saint Andrew", 11, 30),
+    ("Saint Thomas", 12, 21),
+    ("Saint Stephen", 12, 26),
+    ("Saint John", 12, 27),
+    ("Holy Innocents", 12, 28),
+    ("Holy Name", 1, 1),
+    ("Confession of Saint Peter", 1, 18),
+    ("Conversion of Saint Paul", 1, 25),
+    ("The Presentation", 2, 2),
+    ("Saint Matthias", 2, 24),
+    ("Saint Joseph", 3, 19),
+    ("The Annunciation", 3, 25),
+    ("Saint Mark", 4, 25),
+    ("Saint Philip and Saint James", 5, 1),
+    ("The Visitation", 5, 31),
+    ("Saint Barnabas", 6, 11),
+    ("Nativity of Saint John the Baptist", 6, 24),
+    ("Saint Peter and Saint Paul", 6, 29),
+    ("Saint Mary Magdalene", 7, 22),
+    ("Saint James", 7, 25),
+    ("The Transfiguration", 8, 6),
+    ("Saint Mary the Virgin", 8, 15),
+    ("Saint Bartholomew", 8, 24),
+    ("Holy Cross Day", 9, 14),
+    ("Saint Matthew", 9, 21),
+    ("Saint Michael and All Angels", 9, 29),
+    ("Saint Luke", 10, 18),
+    ("Saint James of Jerusalem", 10, 23),
+    ("Saint Simon and Saint Jude", 10, 28),
+)
+
+
+class FixedRule(NamedTuple):
+    """A holy day which falls on the same month and day every year. When
+    sundays_only is set, it is only observed if that date is a Sunday."""
+
+    name: str
+    rank: Rank
+    month: int
+    day: int
+    sundays_only: bool = False
+
+
+class MoveableRule(NamedTuple):
+    """A holy day which falls a number of days from one of the year's
+    anchor dates. When start or end are given as (anchor, offset) pairs,
+    the holy day is only observed on or after the start and before the
+    end, which is how the numbered Sundays give way in short seasons."""
+
+    name: str
+    rank: Rank
+    anchor: str
+    offset: int
+    start: tuple[str, int] | None = None
+    end: tuple[str, int] | None = None
+
+
+CalendarRule = FixedRule | MoveableRule
+
+# The seasons in the order they begin within a calendar year. Christmas
+# appears twice because it runs across the new year.
+SEASONS: tuple[str, ...] = (
+    "Christmas",
+    "Epiphany",
+    "Lent",
+    "Easter",
+    "Pentecost",
+    "Advent",
+    "Christmas",
+)
+
+ADVENT_SEASON = SEASONS.index("Advent")
+
+
+class YearAnchors:
+    """The YearAnchors class calculates the anchor dates of a calendar year
+    once, so they can be shared by everything that asks about that year.
+
+    The dates on which each season after the first begins are kept as a
+    sorted list of ordinals, so the season of a date, and whether it falls
+    before or after Advent, is found with a single bisect.
+    """
+
+    def __init__(self, year: int) -> None:
+        self.year: int = year
+        easter_day = easter(year)
+        self.moveable_dates: dict[str, date] = {
+            "easter_day": easter_day,
+            "ash_wednesday": easter_day - timedelta(days=46),
+            "pentecost": easter_day + timedelta(days=49),
+            "advent_sunday": date(year, 12, 25)
+            + relativedelta(days=-1, weekday=SU(-4)),
+        }
+        self.anchors: dict[str, date] = get_anchors(year, self.moveable_dates)
+        self.season_starts: list[int] = [
+            date(year, 1, 6).toordinal(),
+            self.moveable_dates["ash_wednesday"].toordinal(),
+            self.moveable_dates["easter_day"].toordinal(),
+            self.moveable_dates["pentecost"].toordinal(),
+            self.moveable_dates["advent_sunday"].toordinal(),
+            date(year, 12, 25).toordinal(),
+        ]
+
+    def get_season_index(self, this_date: date) -> int:
+        """Get the index into SEASONS of the season of the given date."""
+
+        return bisect_right(self.season_starts, this_date.toordinal())
+
+    def get_liturgical_season(self, this_date: date) -> str:
+        """Get the liturgical season for the given date."""
+
+        return SEASONS[self.get_season_index(this_date)]
+
+    def get_liturgical_year(self, this_date: date) -> str:
+        """Get the lectionary year (A, B, or C) for the given date. A new
+        lectionary year begins on the First Sunday of Advent."""
+
+        after_advent = self.get_season_index(this_date) >= ADVENT_SEASON
+        return f"Year {"ABC"[(self.year - 1 + after_advent) % 3]}"
+
+
+@lru_cache(maxsize=1024)
+def get_year_anchors(year: int) -> YearAnchors:
+    """Get the anchor dates of a calendar year, calculating them only the
+    first time the year is asked for."""
+
+    return YearAnchors(year)
+
+
+def get_moveable_dates(year: int) -> dict[str, date]:
+    """Calculate the dates of the moveable feasts for a calendar year."""
+
+    return dict(get_year_anchors(year).moveable_dates)
+
+
+def get_anchors(
+    year: int, moveable_dates: dict[str, date] | None = None
+) -> dict[str, date]:
+    """Get every date that a MoveableRule can be counted from: the
+    moveable feasts along with the First Sunday after Epiphany."""
+
+    if moveable_dates is None:
+        return get_year_anchors(year).anchors
+    epiphany = date(year, 1, 6)
+    return {
+        **moveable_dates,
+        "first_sunday_after_epiphany": epiphany
+        + timedelta(days=7 - (epiphany.weekday() + 1) % 7),
+    }
+
+
+class Calendar:
+    """The Calendar class compiles a list of rules into lookup tables. The
+    fixed rules are keyed by month and day, and the moveable rules by their
+    anchor and offset, so finding the holy days on a date takes one lookup
+    for the fixed rules and one for each anchor, no matter how many rules
+    there are.
+
+    Holy days are always listed in order of precedence, which is the order
+    in which each holy day's first rule was given. Other calendars, such as
+    one with commemorations added, are made by passing more rules.
+    """
+
+    def __init__(self, rules: Iterable[CalendarRule]) -> None:
+        rules = list(rules)
+        self.priorities: dict[str, int] = {}
+        for rule in rules:
+            self.priorities.setdefault(rule.name, len(self.priorities))
+        self.rules: tuple[CalendarRule, ...] = tuple(
+            sorted(rules, key=lambda rule: self.priorities[rule.name])
+        )
+
+        self.__fixed: dict[tuple[int, int], list[FixedRule]] = {}
+        self.__moveable: dict[str, dict[int, list[MoveableRule]]] = {}
+        self.__by_name: dict[str, list[CalendarRule]] = {}
+        for rule in self.rules:
+            if isinstance(rule, FixedRule):
+                self.__fixed.setdefault((rule.month, rule.day), []).append(
+                    rule
+                )
+            else:
+                self.__moveable.setdefault(rule.anchor, {}).setdefault(
+                    rule.offset, []
+                ).append(rule)
+            self.__by_name.setdefault(rule.name, []).append(rule)
+
+    def get_rules(
+        self, this_date: date, anchors: dict[str, date]
+    ) -> list[CalendarRule]:
+        """Get the rules of the holy days which fall on the given date, in
+        order of precedence. The anchors must be those of the date's year.
+        """
+
+        found: list[CalendarRule] = []
+        for rule in self.__fixed.get((this_date.month, this_date.day), ()):
+            if not rule.sundays_only or this_date.weekday() == 6:
+                found.append(rule)
+
+        for anchor, offsets in self.__moveable.items():
+            days = (this_date - anchors[anchor]).days
+            for rule in offsets.get(days, ()):
+                if self.__in_window(rule, this_date, anchors):
+                    found.append(rule)
+
+        if len(found) > 1:
+            found.sort(key=lambda rule: self.priorities[rule.name])
+        return found
+
+    def get_dates(
+        self, day_name: str, year: int, anchors: dict[str, date]
+    ) -> list[date]:
+        """Get the dates in a calendar year on which the named holy day
+        falls. The anchors must be those of the same year.
+
+        Raises ValueError if the calendar has no such holy day.
+        """
+
+        try:
+            rules = self.__by_name[day_name]
+        except KeyError as exc:
+            raise ValueError(f"Error: unknown holy day {day_name!r}") from exc
+
+        return sorted(
+            this_date
+            for rule in rules
+            if (this_date := self.get_date(rule, year, anchors)) is not None
+        )
+
+    def get_date(
+        self, rule: CalendarRule, year: int, anchors: dict[str, date]
+    ) -> date | None:
+        """Get the date on which a rule falls in a calendar year, or None if
+        it is not observed that year."""
+
+        if isinstance(rule, FixedRule):
+            try:
+                this_date = date(year, rule.month, rule.day)
+            except ValueError:
+                return None  # February 29 in a common year
+            if rule.sundays_only and this_date.weekday() != 6:
+                return None
+            return this_date
+
+        this_date = anchors[rule.anchor] + timedelta(days=rule.offset)
+        if not self.__in_window(rule, this_date, anchors):
+            return None
+        return this_date
+
+    @staticmethod
+    def __in_window(
+        rule: MoveableRule, this_date: date, anchors: dict[str, date]
+    ) -> bool:
+        if rule.start is not None:
+            anchor, offset = rule.start
+            if (this_date - anchors[anchor]).days < offset:
+                return False
+        if rule.end is not None:
+            anchor, offset = rule.end
+            if (this_date - anchors[anchor]).days >= offset:
+                return False
+        return True
+
+
+def _get_rules() -> list[CalendarRule]:
+    rules: list[CalendarRule] = []
+
+    for day_name, offset in PRINCIPAL_FEASTS_FROM_EASTER:
+        rules.append(
+            MoveableRule(day_name, Rank.PRINCIPAL, "easter_day", offset)
+        )
+    for day_name, month, day in PRINCIPAL_FEASTS_FIXED:
+        rules.append(FixedRule(day_name, Rank.PRINCIPAL, month, day))
+
+    rules.append(MoveableRule("Ash Wednesday", Rank.FIXED, "ash_wednesday", 0))
+    for i, day_name in enumerate(HOLY_WEEK):
+        rules.append(MoveableRule(day_name, Rank.FIXED, "easter_day", i - 7))
+    for i, day_name in enumerate(EASTER_WEEK):
+        rules.append(MoveableRule(day_name, Rank.FIXED, "easter_day", i + 1))
+
+    for i, day_name in enumerate(ADVENT_SUNDAYS):
+        rules.append(
+            MoveableRule(day_name, Rank.SUNDAY, "advent_sunday", 7 * i)
+        )
+
+    # A Sunday from December 26 to 31 is the First Sunday after Christmas,
+    # and one from January 1 to 5 is the Second. Christmas Day on a Sunday
+    # also begins a new week of Sundays after Christmas.
+    for day in range(26, 32):
+        rules.append(
+            FixedRule(
+                "First Sunday after Christmas", Rank.SUNDAY, 12, day, True
+            )
+        )
+    for month, day in [(12, 25), (1, 1), (1, 2), (1, 3), (1, 4), (1, 5)]:
+        rules.append(
+            FixedRule(
+                "Second Sunday after Christmas", Rank.SUNDAY, month, day, True
+            )
+        )
+
+    # The number of Sundays after Epiphany can range from 4 to 9, so the
+    # final two Sundays take the place of any numbered Sunday.
+    for i, day_name in enumerate(EPIPHANY_SUNDAYS):
+        rules.append(
+            MoveableRule(
+                day_name,
+                Rank.SUNDAY,
+                "first_sunday_after_epiphany",
+                7 * i,
+                end=("easter_day", -56),
+            )
+        )
+    rules.append(
+        MoveableRule(
+            "Second to Last Sunday after Epiphany",
+            Rank.SUNDAY,
+            "easter_day",
+            -56,
+        )
+    )
+    rules.append(
+        MoveableRule(
+            "Last Sunday after Epiphany", Rank.SUNDAY, "easter_day", -49
+        )
+    )
+    for i, day_name in enumerate(LENT_SUNDAYS):
+        rules.append(
+            MoveableRule(day_name, Rank.SUNDAY, "easter_day", 7 * i - 42)
+        )
+    for i, day_name in enumerate(EASTER_SUNDAYS):
+        rules.append(
+            MoveableRule(day_name, Rank.SUNDAY, "easter_day", 7 * i + 7)
+        )
+
+    # Only the Propers which fall after Pentecost are observed.
+    for i, day_name in enumerate(PROPERS):
+        rules.append(
+            MoveableRule(
+                day_name,
+                Rank.SUNDAY,
+                "advent_sunday",
+                7 * i - 203,
+                start=("pentecost", 0),
+            )
+        )
+
+    for day_name, month, day in RED_LETTER_DAYS:
+        rules.append(FixedRule(day_name, Rank.MAJOR, month, day))
+
+    return rules
+
+
+# Every rule of the lectionary, ordered by precedence group so that holy days
+# sharing a date are listed in the same order that Lectionary reports them.
+RULES: tuple[CalendarRule, ...] = tuple(_get_rules())
+
+CALENDAR = Calendar(RULES)
+
+
+def get_observance_dates(
+    day_name: str, year: int, moveable_dates: dict[str, date] | None = None
+) -> list[date]:
+    """Get the dates in a calendar year on which the named holy day falls.
+
+    Most holy days fall exactly once a year, but a numbered Sunday may not
+    occur at all in a short season, and the Sundays after Christmas can
+    occur twice in the same calendar year.
+    """
+
+    return CALENDAR.get_dates(
+        day_name, year, get_anchors(year, moveable_dates)
+    )
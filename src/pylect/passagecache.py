@@ -0,0 +1,171 @@
+"""Provides access to the PassageCache class."""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from pylect.constants import get_cache_dir
+
+# The most keys looked up in a single statement, which keeps each query
+# within SQLite's limit on the number of parameters.
+MAX_PARAMETERS = 500
+
+
+class PassageCache:
+    """The PassageCache class stores the text of Scripture passages in a
+    SQLite database so that passages fetched once never need to be fetched
+    again. Entries are keyed by the normalized query together with the
+    request parameters used to fetch them.
+
+    Entries older than max_age seconds are treated as missing, and when
+    the cache grows beyond max_entries the least recently used entries are
+    evicted.
+
+    One connection is kept open for the life of the cache and shared by
+    every thread. Reads never write to the database: the time each entry
+    was last used is kept in memory and only saved by the next call to
+    set() or flush(), so a cache hit costs a single SELECT.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        max_age: float = 365 * 24 * 60 * 60,
+        max_entries: int = 5000,
+    ) -> None:
+        self.path: Path = path or get_cache_dir() / "passages.sqlite3"
+        self.max_age: float = max_age
+        self.max_entries: int = max_entries
+        self.__accessed: dict[str, float] = {}
+        self.__lock = threading.Lock()
+        self.__conn: sqlite3.Connection = self.__connect()
+
+    def get(self, query: str, params: dict) -> str | None:
+        """Get the cached text for a query, or None if it is not cached."""
+
+        entry = self.get_with_age(query, params)
+        if entry is None or entry[1] > self.max_age:
+            return None
+        return entry[0]
+
+    def get_with_age(
+        self, query: str, params: dict
+    ) -> tuple[str, float] | None:
+        """Get the cached text for a query along with its age in seconds,
+        even if it is older than max_age, or None if it is not cached.
+        """
+
+        return self.get_many([query], params).get(query)
+
+    def get_many(
+        self, queries: list[str], params: dict
+    ) -> dict[str, tuple[str, float]]:
+        """Get the cached text of several queries at once, along with their
+        ages in seconds as in get_with_age, in the order of the queries.
+        Queries which are not cached are left out.
+        """
+
+        keys: dict[str, list[str]] = {}
+        for query in queries:
+            keys.setdefault(self.__get_key(query, params), []).append(query)
+
+        now = time.time()
+        found: dict[str, tuple[str, float]] = {}
+        key_list = list(keys)
+        with self.__lock:
+            for i in range(0, len(key_list), MAX_PARAMETERS):
+                chunk = key_list[i : i + MAX_PARAMETERS]
+                rows = self.__conn.execute(
+                    "SELECT key, text, fetched_at FROM passages WHERE key IN"
+                    f" ({", ".join("?" * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for key, text, fetched_at in rows:
+                    self.__accessed[key] = now
+                    for query in keys[key]:
+                        found[query] = (text, now - fetched_at)
+        return {query: found[query] for query in queries if query in found}
+
+    def set(self, query: str, params: dict, text: str) -> None:
+        """Store the text for a query and evict any expired entries."""
+
+        key = self.__get_key(query, params)
+        now = time.time()
+        with self.__lock, self.__conn:
+            self.__conn.execute(
+                "INSERT OR REPLACE INTO passages VALUES (?, ?, ?, ?)",
+                (key, text, now, now),
+            )
+            self.__accessed.pop(key, None)
+            self.__save_accessed()
+            self.__conn.execute(
+                "DELETE FROM passages WHERE fetched_at < ?",
+                (now - self.max_age,),
+            )
+            self.__conn.execute(
+                "DELETE FROM passages WHERE key NOT IN (SELECT key FROM"
+                " passages ORDER BY accessed_at DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+
+    def flush(self) -> None:
+        """Save the times at which entries were last read."""
+
+        with self.__lock, self.__conn:
+            self.__save_accessed()
+
+    def info(self) -> dict:
+        """Get the location, number of entries, and size of the cache."""
+
+        with self.__lock:
+            entries, size = self.__conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(text)), 0)"
+                " FROM passages"
+            ).fetchone()
+        return {"path": str(self.path), "entries": entries, "size": size}
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+
+        with self.__lock, self.__conn:
+            self.__conn.execute("DELETE FROM passages")
+            self.__accessed.clear()
+
+    def close(self) -> None:
+        """Save the read times and close the connection to the database."""
+
+        self.flush()
+        self.__conn.close()
+
+    def __connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+        try:
+            # With a write-ahead log, a commit does not have to wait for the
+            # database file itself to be synced to disk.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS passages (key TEXT PRIMARY"
+                    " KEY, text TEXT, fetched_at REAL, accessed_at REAL)"
+                )
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def __save_accessed(self) -> None:
+        if self.__accessed:
+            self.__conn.executemany(
+                "UPDATE passages SET accessed_at = ? WHERE key = ?",
+                [(t, key) for key, t in self.__accessed.items()],
+            )
+            self.__accessed.clear()
+
+    @staticmethod
+    def __get_key(query: str, params: dict) -> str:
+        normalized = " ".join(query.split()).lower()
+        return json.dumps([normalized, params], sort_keys=True)
@@ -0,0 +1,206 @@
+"""Provides access to the PassageIndex class, which finds the holy days
+whose lessons read from any given passage of Scripture.
+"""
+
+import re
+from bisect import bisect_right
+from functools import cache
+from typing import NamedTuple
+
+from pylect.compiledlectionary import (
+    CompiledLectionary,
+    get_compiled_lectionary,
+)
+
+# Books with only one chapter are cited by verse alone, as in "Jude 1-4".
+SINGLE_CHAPTER_BOOKS = {"obadiah", "philemon", "2 john", "3 john", "jude"}
+
+BOOK_ALIASES = {"psalm": "psalms", "neh": "nehemiah"}
+
+# Stands in for the last verse of a chapter when a whole chapter is cited.
+END_OF_CHAPTER = 999
+
+REFERENCE = re.compile(r"^\s*((?:[1-3] )?[A-Za-z][A-Za-z ]*?)\s*(\(?\d.*)$")
+
+
+class PassageRange(NamedTuple):
+    """A contiguous range of Scripture within one book. The start and end
+    are (chapter, verse) tuples, inclusive of both ends."""
+
+    book: str
+    start: tuple[int, int]
+    end: tuple[int, int]
+
+    def overlaps(self, other: "PassageRange") -> bool:
+        """Check whether two ranges share at least one verse."""
+
+        return (
+            self.book == other.book
+            and self.start <= other.end
+            and other.start <= self.end
+        )
+
+
+class LessonEntry(NamedTuple):
+    """A lesson in the lectionary. The service is only given for holy days
+    with more than one set of lessons, such as Christmas Day."""
+
+    day_name: str
+    year: str
+    lesson: str
+    reference: str
+    service: str | None = None
+
+
+def normalize_book(book: str) -> str:
+    """Make book names comparable, so that "Psalm" and "psalms" match."""
+
+    book = " ".join(book.split()).lower()
+    return BOOK_ALIASES.get(book, book)
+
+
+def parse_scripture_reference(reference: str) -> list[PassageRange]:
+    """Parse a Scripture reference such as "Luke 2:1-14, (15-20)" or
+    "Joshua (4:19-24); 5:1, (2-8), 9-12" into the ranges it covers.
+    Optional verses in parentheses are included, and partial verses like
+    "5a" are treated as the whole verse.
+
+    Raises ValueError if the reference cannot be parsed.
+    """
+
+    match = REFERENCE.match(reference)
+    if match is None:
+        raise ValueError(f"Error: invalid Scripture reference {reference!r}")
+
+    book = normalize_book(match.group(1))
+    citation = re.sub(r"[a-z]", "", match.group(2))
+    segments = [s.strip() for s in re.split(r"[;,()]", citation) if s.strip()]
+
+    try:
+        if ":" in citation:
+            return _parse_verse_segments(book, segments)
+        return _parse_chapter_segments(book, segments)
+    except ValueError as exc:
+        raise ValueError(
+            f"Error: invalid Scripture reference {reference!r}"
+        ) from exc
+
+
+def _parse_chapter_segments(
+    book: str, segments: list[str]
+) -> list[PassageRange]:
+    if book in SINGLE_CHAPTER_BOOKS:
+        return _parse_verse_segments(book, segments, chapter=1)
+
+    # A reference like "Psalm 33(1-9), 10-21" gives the chapter first and
+    # leaves out the colon before the verses.
+    if len(segments) > 1 and "-" not in segments[0]:
+        return _parse_verse_segments(
+            book, segments[1:], chapter=int(segments[0])
+        )
+
+    ranges = []
+    for segment in segments:
+        first, _, last = segment.partition("-")
+        ranges.append(
+            PassageRange(
+                book,
+                (int(first), 0),
+                (int(last or first), END_OF_CHAPTER),
+            )
+        )
+    return ranges
+
+
+def _parse_verse_segments(
+    book: str, segments: list[str], chapter: int | None = None
+) -> list[PassageRange]:
+    ranges = []
+    for segment in segments:
+        # Optional verses at the start of a chapter leave the chapter on its
+        # own, as in "Luke 2:(1-14), 15-20".
+        if segment.endswith(":"):
+            chapter = int(segment[:-1])
+            continue
+
+        first, _, last = segment.partition("-")
+        if ":" in first:
+            chapter_text, verse_text = first.split(":")
+            chapter = int(chapter_text)
+            start = (chapter, int(verse_text))
+        elif chapter is None:
+            raise ValueError(f"Error: missing chapter in {segment!r}")
+        else:
+            start = (chapter, int(first))
+
+        if not last:
+            end = start
+        elif ":" in last:
+            chapter_text, verse_text = last.split(":")
+            chapter = int(chapter_text)
+            end = (chapter, int(verse_text))
+        else:
+            end = (chapter, int(last))
+        ranges.append(PassageRange(book, start, end))
+    return ranges
+
+
+class PassageIndex:
+    """The PassageIndex class maps every passage read in the lectionary
+    back to the holy days, years, and lessons that read it. The ranges for
+    each book are kept sorted by their start, so a query only has to check
+    the ranges which begin before the passage it is looking for ends.
+
+    Lessons that are not Scripture references, such as the canticles, are
+    left out of the index.
+    """
+
+    def __init__(self, lectionary: CompiledLectionary) -> None:
+        self.ranges: dict[str, list[tuple[PassageRange, LessonEntry]]] = {}
+        self.__build(lectionary)
+        self.__starts: dict[str, list[tuple[int, int]]] = {
+            book: [r.start for r, _ in ranges]
+            for book, ranges in self.ranges.items()
+        }
+
+    def find(self, reference: str) -> list[LessonEntry]:
+        """Find every lesson which reads any part of the given passage,
+        such as "Isaiah 40:1-11" or the whole chapter "Romans 8"."""
+
+        found: dict[LessonEntry, None] = {}
+        for query in parse_scripture_reference(reference):
+            ranges = self.ranges.get(query.book, [])
+            stop = bisect_right(self.__starts.get(query.book, []), query.end)
+            for passage, entry in ranges[:stop]:
+                if passage.overlaps(query):
+                    found[entry] = None
+        return list(found)
+
+    def __build(self, lectionary: CompiledLectionary) -> None:
+        for day_name, service, year, lessons in lectionary.iter_lessons():
+            self.__add_lessons(day_name, year, lessons, service)
+
+        for ranges in self.ranges.values():
+            ranges.sort(key=lambda item: item[0].start)
+
+    def __add_lessons(
+        self, day_name: str, year: str, lessons: dict, service: str | None
+    ) -> None:
+        for lesson, references in lessons.items():
+            for reference in references:
+                try:
+                    passages = parse_scripture_reference(reference)
+                except ValueError:
+                    continue
+                entry = LessonEntry(day_name, year, lesson, reference, service)
+                for passage in passages:
+                    self.ranges.setdefault(passage.book, []).append(
+                        (passage, entry)
+                    )
+
+
+@cache
+def get_passage_index() -> PassageIndex:
+    """Get the PassageIndex for the lectionary, building it on first use."""
+
+    return PassageIndex(get_compiled_lectionary())
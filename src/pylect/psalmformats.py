@@ -0,0 +1,88 @@
+"""Defines the output formats available for rendering psalm texts. Each
+format is a function which takes a psalm and a list of (verse, optional)
+pairs and returns the formatted text. Additional formats can be added with
+register_format before any psalms are rendered in that format.
+"""
+
+from collections.abc import Callable
+from html import escape
+
+Renderer = Callable[[dict, list[tuple[dict, bool]]], str]
+
+
+def render_plain(psalm: dict, verses: list[tuple[dict, bool]]) -> str:
+    """Render a psalm as indented plain text."""
+
+    text_list = []
+    text_list.append(f"Psalm {psalm["number"]}\n")
+    text_list.append(f"{psalm["latin_title"]}\n")
+    for verse, _ in verses:
+        text_list.append(f"    {verse["number"]} {verse["first_half"]} *")
+        text_list.append(f"        {verse["second_half"]}")
+    return "\n".join(text_list)
+
+
+def render_markdown(psalm: dict, verses: list[tuple[dict, bool]]) -> str:
+    """Render a psalm as Markdown, with one paragraph for each verse."""
+
+    text_list = []
+    text_list.append(f"### Psalm {psalm["number"]}\n")
+    text_list.append(f"*{psalm["latin_title"]}*\n")
+    for verse, _ in verses:
+        text_list.append(
+            f"**{verse["number"]}** {verse["first_half"]} \\*  \n"
+            f"{verse["second_half"]}\n"
+        )
+    return "\n".join(text_list).rstrip("\n")
+
+
+def render_html(psalm: dict, verses: list[tuple[dict, bool]]) -> str:
+    """Render a psalm as an HTML fragment. Optional verses are given the
+    "optional" class so they can be styled differently."""
+
+    text_list = []
+    text_list.append('<div class="psalm">')
+    text_list.append(f"<h3>Psalm {psalm["number"]}</h3>")
+    text_list.append(
+        f'<p class="latin-title"><em>{escape(psalm["latin_title"])}</em></p>'
+    )
+    for verse, optional in verses:
+        css_class = "verse optional" if optional else "verse"
+        text_list.append(
+            f'<p class="{css_class}">'
+            f'<span class="verse-number">{verse["number"]}</span> '
+            f"{escape(verse["first_half"])} *<br>"
+            f"{escape(verse["second_half"])}</p>"
+        )
+    text_list.append("</div>")
+    return "\n".join(text_list)
+
+
+def render_bulletin(psalm: dict, verses: list[tuple[dict, bool]]) -> str:
+    """Render a psalm for printing in a bulletin. The verse numbers of any
+    optional verses are enclosed in parentheses."""
+
+    text_list = []
+    text_list.append(f"Psalm {psalm["number"]}")
+    text_list.append(f"{psalm["latin_title"]}\n")
+    for verse, optional in verses:
+        number = f"({verse["number"]})" if optional else f"{verse["number"]}"
+        text_list.append(f"{number} {verse["first_half"]} *")
+        text_list.append(f"    {verse["second_half"]}")
+    if any(optional for _, optional in verses):
+        text_list.append("\nVerses in parentheses may be omitted.")
+    return "\n".join(text_list)
+
+
+FORMATS: dict[str, Renderer] = {
+    "plain": render_plain,
+    "markdown": render_markdown,
+    "html": render_html,
+    "bulletin": render_bulletin,
+}
+
+
+def register_format(name: str, renderer: Renderer) -> None:
+    """Add a new output format, or replace an existing one."""
+
+    FORMATS[name] = renderer
@@ -0,0 +1,80 @@
+"""Provides access to the PsalmIndex class."""
+
+import re
+from bisect import bisect_left
+from collections.abc import Sequence
+
+WORD = re.compile(r"\w+")
+TERM = re.compile(r"\w+\*?")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase words."""
+
+    return WORD.findall(text.lower())
+
+
+class PsalmIndex:
+    """The PsalmIndex class is an inverted index of every word in the
+    Psalter. Each word maps to the set of places it occurs, given as
+    (psalm index, verse index, word position) tuples, so a search only has
+    to look at the verses which contain the words being searched for.
+    """
+
+    def __init__(self, psalms: Sequence[dict]) -> None:
+        self.postings: dict[str, set[tuple[int, int, int]]] = {}
+        self.locations: list[list[tuple[int, int]]] = []
+        self.__build(psalms)
+        self.words: list[str] = sorted(self.postings)
+
+    def search(self, query: str) -> list[tuple[int, int]]:
+        """Find every verse containing the words of the query as a phrase,
+        returned as (psalm number, verse number) pairs in Psalter order.
+
+        A word ending in "*" matches any word beginning with it, so
+        "shepherd*" also matches "shepherds".
+        """
+
+        terms = TERM.findall(query.lower())
+        if not terms:
+            return []
+
+        matches = [self.__get_postings(term) for term in terms]
+
+        # Start from the rarest term and check that every other term sits at
+        # the right position around it.
+        rarest = min(range(len(matches)), key=lambda i: len(matches[i]))
+        found: set[tuple[int, int]] = set()
+        for psalm, verse, position in matches[rarest]:
+            start = position - rarest
+            if all(
+                (psalm, verse, start + i) in postings
+                for i, postings in enumerate(matches)
+            ):
+                found.add((psalm, verse))
+
+        return [self.locations[psalm][verse] for psalm, verse in sorted(found)]
+
+    def __get_postings(self, term: str) -> set[tuple[int, int, int]]:
+        if not term.endswith("*"):
+            return self.postings.get(term, set())
+
+        word = term[:-1]
+        postings: set[tuple[int, int, int]] = set()
+        i = bisect_left(self.words, word)
+        while i < len(self.words) and self.words[i].startswith(word):
+            postings |= self.postings[self.words[i]]
+            i += 1
+        return postings
+
+    def __build(self, psalms: Sequence[dict]) -> None:
+        locations = []
+        for p, psalm in enumerate(psalms):
+            verse_locations = []
+            for v, verse in enumerate(psalm["verses"]):
+                verse_locations.append((psalm["number"], verse["number"]))
+                text = f"{verse["first_half"]} {verse["second_half"]}"
+                for position, word in enumerate(tokenize(text)):
+                    self.postings.setdefault(word, set()).add((p, v, position))
+            locations.append(verse_locations)
+        self.locations = locations
@@ -2,17 +2,103 @@
 
 import json
 import re
-from importlib.resources import files
+import threading
+from collections.abc import Iterable, Sequence
+from functools import cache, lru_cache
+from typing import NamedTuple
+
+from pylect.compiledpsalter import CompiledPsalms
+from pylect.constants import DATA_DIR
+from pylect.psalmformats import FORMATS
+from pylect.psalmindex import PsalmIndex
+
+RENDER_CACHE_SIZE = 256
+
+
+class VerseRange(NamedTuple):
+    """A range of verses in a psalm reference, inclusive of both ends. The
+    lectionary marks optional verses by enclosing them in parentheses."""
+
+    start: int
+    end: int
+    optional: bool = False
+
+
+class PsalmReference(NamedTuple):
+    """A parsed psalm reference. A reference with no verse ranges refers to
+    the whole psalm."""
+
+    chapter: int
+    ranges: tuple[VerseRange, ...] = ()
+
+    def verses(self) -> list[int]:
+        """Get the verse numbers included in the reference, in order."""
+
+        return [v for r in self.ranges for v in range(r.start, r.end + 1)]
+
+    def optional_verses(self) -> set[int]:
+        """Get the verse numbers which are marked as optional."""
+
+        return {
+            v
+            for r in self.ranges
+            if r.optional
+            for v in range(r.start, r.end + 1)
+        }
+
+
+@lru_cache(maxsize=1024)
+def parse_psalm_reference(reference: str) -> PsalmReference:
+    """Make human-readable psalm references computer-friendly. The result
+    is cached, so each distinct reference is only ever parsed once.
+
+    Raises ValueError if the reference cannot be parsed.
+    """
+
+    ref = reference.replace("Psalm ", "")
+
+    # A few references leave out the colon when the first verses are
+    # optional, as in "Psalm 33(1-9), 10-21".
+    if ":" not in ref and "(" in ref:
+        ref = ref.replace("(", ":(", 1)
+
+    chapter = int(ref.split(":")[0])
+    if ":" not in ref:
+        return PsalmReference(chapter)
+
+    ranges: list[VerseRange] = []
+    optional = False
+    for token in re.split(r"(;|,|\(|\)| )", ref.split(":")[1]):
+        if token in ("(", ")"):
+            optional = token == "("
+        elif token in ("", ";", ",", " "):
+            continue
+        elif "-" in token:
+            start = token.split("-")[0]
+            end = token.split("-")[1]
+            ranges.append(VerseRange(int(start), int(end), optional))
+        else:
+            ranges.append(VerseRange(int(token), int(token), optional))
+
+    return PsalmReference(chapter, tuple(ranges))
 
 
 class Psalter:
     """The Psalter class imports the text of the New Coverdale Psalter as a
-    dictionary and provides methods for getting the text of the Psalms."""
+    dictionary and provides methods for getting the text of the Psalms.
 
-    def __init__(self) -> None:
-        self.psalms: dict = self.__load_psalms_from_json()
+    When the compiled Psalter (see pylect.compiledpsalter) is available, it
+    is memory-mapped instead of parsing the much larger JSON file."""
 
-    def get_psalm(self, reference: str) -> str:
+    def __init__(self) -> None:
+        self.psalms: Sequence[dict] = self.__load_psalms()
+        self.__render_cached = lru_cache(maxsize=RENDER_CACHE_SIZE)(
+            self.__render
+        )
+        self.__index: PsalmIndex | None = None
+        self.__index_lock = threading.Lock()
+
+    def get_psalm(self, reference: str, fmt: str = "plain") -> str:
         """Get formatted psalm text by chapter and verse reference.
 
         Valid references must include the "chapter" number and may include
@@ -28,58 +114,99 @@ class Psalter:
         "23:1-3(4-6)" -> returns verses 1-6
 
         The lectionary indicates optional verses by enclosing them in
-        parentheses. For now, these are always included in the returned text.
+        parentheses. These are always included in the returned text, but
+        the "bulletin" and "html" formats mark them as optional.
+
+        The fmt argument selects one of the output formats defined in
+        pylect.psalmformats: "plain", "markdown", "html", or "bulletin".
+        Rendered psalms are cached, so requesting the same reference in the
+        same format again does not render it a second time.
         """
 
-        chapter, verses = self.__parse_reference(reference)
-        psalm = self.psalms[chapter - 1]  # convert to zero index
+        if fmt not in FORMATS:
+            raise ValueError(f"Error: unknown psalm format {fmt!r}")
+        return self.__render_cached(reference, fmt)
 
-        if len(verses) == 0:  # if only chapter ref was provided
-            verses = psalm["verses"]
-        else:
-            verses = [psalm["verses"][v - 1] for v in verses]
+    def get_psalms(
+        self, references: Iterable[str], fmt: str = "plain"
+    ) -> list[str]:
+        """Get formatted psalm texts for many references at once, in the
+        same order as the references. See get_psalm for the format of valid
+        references.
+        """
 
-        text_list = []
-        text_list.append(f"Psalm {psalm["number"]}\n")
-        text_list.append(f"{psalm["latin_title"]}\n")
-        for verse in verses:
-            text_list.append(f"    {verse["number"]} {verse["first_half"]} *")
-            text_list.append(f"        {verse["second_half"]}")
-        psalm_text = "\n".join(text_list)
+        return [self.get_psalm(ref, fmt) for ref in references]
 
-        return psalm_text
+    def search(self, query: str) -> list[tuple[int, int]]:
+        """Find the verses containing a word or phrase, returned as
+        (psalm number, verse number) pairs. A word ending in "*" matches
+        any word beginning with it.
 
-    def __parse_reference(self, ref: str) -> tuple[int, list[int]]:
-        """Make human-readable psalm references computer-friendly."""
+        The search index is built the first time this is called.
+        """
 
-        ref = ref.replace("Psalm ", "")
-        chapter = int(ref.split(":")[0])
-        if ":" in ref:
-            verses = self.__parse_verses(ref.split(":")[1])
-        else:
-            verses = []
+        return self.get_index().search(query)
 
-        return chapter, verses
+    def get_index(self) -> PsalmIndex:
+        """Get the full-text index of the psalms, building it if needed."""
 
-    def __parse_verses(self, verse_ref: str) -> list[int]:
-        """Parse verse references into a list of verse numbers."""
+        if self.__index is None:
+            with self.__index_lock:
+                if self.__index is None:
+                    self.__index = PsalmIndex(self.psalms)
+        return self.__index
 
-        verse_nums = []
-        for ref in re.split(r";|,|\(|\)| ", verse_ref):
-            if len(ref) == 0:
-                continue
-            if "-" in ref:
-                start = ref.split("-")[0]
-                end = ref.split("-")[1]
-                verse_nums.extend(list(range(int(start), int(end) + 1)))
-            else:
-                verse_nums.append(int(ref))
+    def __render(self, reference: str, fmt: str) -> str:
+        """Build the formatted text of a psalm reference."""
 
-        return verse_nums
+        parsed = parse_psalm_reference(reference)
+        psalm = self.psalms[parsed.chapter - 1]  # convert to zero index
 
-    def __load_psalms_from_json(self) -> dict:
+        if len(parsed.ranges) == 0:  # if only chapter ref was provided
+            verses = [(verse, False) for verse in psalm["verses"]]
+        else:
+            optional = parsed.optional_verses()
+            verses = [
+                (psalm["verses"][v - 1], v in optional)
+                for v in parsed.verses()
+            ]
+
+        return FORMATS[fmt](psalm, verses)
+
+    def __load_psalms(self) -> Sequence[dict]:
+        """Load the compiled psalms, or the JSON psalms if they have not
+        been compiled or were compiled from an older JSON file."""
+
+        psalter_bin = DATA_DIR / "psalter.bin"
+        if psalter_bin.is_file():
+            try:
+                return CompiledPsalms(psalter_bin, DATA_DIR / "psalter.json")
+            except (OSError, ValueError):
+                pass  # stale or unreadable, so use the JSON instead
+        return self.__load_psalms_from_json()
+
+    def __load_psalms_from_json(self) -> list[dict]:
         """Load saved psalm into dictionary"""
 
-        psalter_json = files("pylect.data").joinpath("psalter.json")
+        psalter_json = DATA_DIR / "psalter.json"
         with open(psalter_json, "r", encoding="utf-8") as f:
             return json.load(f)
+
+
+_psalter_lock = threading.Lock()
+
+
+def get_psalter() -> Psalter:
+    """Get the Psalter shared by the whole process. The psalms are loaded
+    the first time this is called and reused by every caller after that.
+    """
+
+    # The lock keeps threads which ask at the same time from each loading
+    # their own copy.
+    with _psalter_lock:
+        return _load_psalter()
+
+
+@cache
+def _load_psalter() -> Psalter:
+    return Psalter()
@@ -0,0 +1,74 @@
+"""Provides access to the RateLimiter class."""
+
+import math
+import threading
+import time
+
+
+class RateLimiter:
+    """The RateLimiter class paces requests so that they never exceed any
+    of several quotas, such as a number of requests per minute, per hour,
+    and per day. Each quota is a token bucket which starts full and refills
+    continuously, so short bursts are allowed while the long-run rate stays
+    within the tightest quota.
+
+    The quotas are given as a dictionary mapping a name to a tuple of the
+    number of requests allowed and the length of the period in seconds.
+    The budget is only tracked for the lifetime of the process.
+    """
+
+    def __init__(self, quotas: dict[str, tuple[int, float]]) -> None:
+        self.quotas: dict[str, tuple[int, float]] = quotas
+        self.__tokens: dict[str, float] = {
+            name: float(limit) for name, (limit, _) in quotas.items()
+        }
+        self.__updated: float = time.monotonic()
+        self.__paused_until: float = 0.0
+        self.__lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Wait until a request is allowed by every quota, then use up one
+        request from each of them.
+        """
+
+        while True:
+            with self.__lock:
+                now = time.monotonic()
+                self.__refill(now)
+                wait = self.__paused_until - now
+                for name, (limit, period) in self.quotas.items():
+                    missing = 1 - self.__tokens[name]
+                    wait = max(wait, missing * period / limit)
+                if wait <= 0:
+                    for name in self.__tokens:
+                        self.__tokens[name] -= 1
+                    return
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request for the given number of seconds, such as
+        when the server asks the client to retry later.
+        """
+
+        with self.__lock:
+            self.__paused_until = max(
+                self.__paused_until, time.monotonic() + seconds
+            )
+
+    def remaining(self) -> dict[str, int]:
+        """Get the number of requests currently left in each quota."""
+
+        with self.__lock:
+            self.__refill(time.monotonic())
+            return {
+                name: math.floor(tokens)
+                for name, tokens in self.__tokens.items()
+            }
+
+    def __refill(self, now: float) -> None:
+        elapsed = now - self.__updated
+        self.__updated = now
+        for name, (limit, period) in self.quotas.items():
+            self.__tokens[name] = min(
+                float(limit), self.__tokens[name] + elapsed * limit / period
+            )
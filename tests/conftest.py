@@ -0,0 +1,10 @@
+# pylint: skip-file
+
+import os
+import tempfile
+
+
+def pytest_configure(config):
+    # Keep the compiled lectionary and other cached data out of the user's
+    # cache directory while the tests run.
+    os.environ["PYLECT_CACHE_DIR"] = tempfile.mkdtemp(prefix="pylect-")
@@ -0,0 +1,45 @@
+# pylint: skip-file
+
+from datetime import date, timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pylect.bulk import (
+    HOLY_DAY_NAMES,
+    LITURGICAL_YEARS,
+    NONE,
+    SEASONS,
+    resolve_dates,
+)
+from pylect.lectionary import Lectionary
+
+
+class TestResolveDates:
+    def test_matches_lectionary(self):
+        dates = [date(2023, 11, 1) + timedelta(days=n) for n in range(800)]
+        resolved = resolve_dates(np.array(dates, dtype="datetime64[D]"))
+        for i, this_date in enumerate(dates):
+            lectionary = Lectionary(this_date)
+            assert SEASONS[resolved.season[i]] == lectionary.liturgical_season
+            assert (
+                LITURGICAL_YEARS[resolved.liturgical_year[i]]
+                == lectionary.liturgical_year
+            )
+            if lectionary.holy_days:
+                primary = lectionary.holy_days[0]
+                assert HOLY_DAY_NAMES[resolved.holy_day[i]] == primary.name
+                assert resolved.rank[i] == primary.rank.value
+            else:
+                assert resolved.holy_day[i] == NONE
+                assert resolved.rank[i] == NONE
+
+    def test_ordinals(self):
+        ordinals = np.array([date(2025, 4, 20).toordinal()])
+        resolved = resolve_dates(ordinals)
+        assert HOLY_DAY_NAMES[resolved.holy_day[0]] == "Easter Day"
+
+    def test_bad_type(self):
+        with pytest.raises(TypeError):
+            resolve_dates(np.array(["2025-04-20"]))
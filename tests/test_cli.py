@@ -0,0 +1,121 @@
+# pylint: skip-file
+
+import argparse
+import csv
+import io
+import json
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from pylect.cli import (
+    check_lectionary,
+    export,
+    get_parser,
+    list_holy_days,
+    parse_args,
+    parse_date,
+    write_records,
+)
+
+
+class TestParseDate:
+    def test_padded(self):
+        assert parse_date("2024-06-08") == date(2024, 6, 8)
+
+    def test_unpadded(self):
+        assert parse_date("2024-11-1") == date(2024, 11, 1)
+
+    @pytest.mark.parametrize("text", ["2024-13-01", "2024-06", "June 8"])
+    def test_invalid(self, text):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_date(text)
+
+
+class TestParseArgs:
+    def test_defaults(self):
+        args = parse_args([])
+        assert args.command == "list"
+        assert args.run is list_holy_days
+        assert args.start_date is None
+        assert args.end_date is None
+        assert args.format == "text"
+
+    def test_dates_and_format(self):
+        args = parse_args(["2024-06-08", "2024-11-1", "--format", "csv"])
+        assert args.command == "list"
+        assert args.start_date == date(2024, 6, 8)
+        assert args.end_date == date(2024, 11, 1)
+        assert args.format == "csv"
+
+    def test_format_only(self):
+        assert parse_args(["--format", "jsonl"]).format == "jsonl"
+
+    def test_list(self):
+        args = parse_args(["list", "2024-06-08"])
+        assert args.start_date == date(2024, 6, 8)
+
+    def test_export(self):
+        args = parse_args(
+            ["export", "2024-12-01", "2025-02-28", "--out", "bulletins"]
+        )
+        assert args.run is export
+        assert args.start_date == date(2024, 12, 1)
+        assert args.end_date == date(2025, 2, 28)
+        assert args.out == Path("bulletins")
+        assert args.format == "plain"
+
+    def test_export_requires_out(self, capsys):
+        with pytest.raises(SystemExit):
+            parse_args(["export", "2024-12-01", "2025-02-28"])
+
+    def test_help_lists_commands(self):
+        text = get_parser().format_help()
+        assert "list" in text
+        assert "export" in text
+
+
+class TestWriteRecords:
+    holy_days = list(check_lectionary(date(2024, 12, 24), date(2024, 12, 26)))
+
+    def test_jsonl(self):
+        output = io.StringIO()
+        write_records(self.holy_days, output, "jsonl")
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert [r["date"] for r in records] == ["2024-12-25", "2024-12-26"]
+        assert records[0] == {
+            "date": "2024-12-25",
+            "name": "Christmas Day",
+            "season": "Christmas",
+            "year": "Year C",
+            "rank": "PRINCIPAL",
+            "lessons": {
+                "First Lesson": ["Isaiah 9:1-7"],
+                "Psalm": ["Psalm 96"],
+                "Second Lesson": ["Titus 2:11-14"],
+                "Gospel": ["Luke 2:1-14, (15-20)"],
+            },
+        }
+
+    def test_csv(self):
+        output = io.StringIO()
+        write_records(self.holy_days, output, "csv")
+        output.seek(0)
+        rows = list(csv.DictReader(output))
+        assert [row["name"] for row in rows] == [
+            "Christmas Day",
+            "Saint Stephen",
+        ]
+        assert rows[1]["rank"] == "MAJOR"
+        assert json.loads(rows[1]["lessons"])["Gospel"] == ["Matthew 23:29-39"]
+
+    def test_streams(self):
+        def holy_days():
+            yield self.holy_days[0]
+            raise RuntimeError
+
+        output = io.StringIO()
+        with pytest.raises(RuntimeError):
+            write_records(holy_days(), output, "jsonl")
+        assert output.getvalue().count("\n") == 1
@@ -0,0 +1,86 @@
+# pylint: skip-file
+
+import marshal
+
+import pytest
+
+from pylect.compiledlectionary import (
+    CompiledLectionary,
+    get_compiled_lectionary,
+    load_compiled_lectionary,
+)
+from pylect.constants import get_lectionary
+
+
+def freeze(lessons):
+    return {lesson: tuple(refs) for lesson, refs in lessons.items()}
+
+
+class TestCompiledLectionary:
+    lectionary = get_compiled_lectionary()
+
+    def test_matches_json(self):
+        rows = 0
+        for name, day in get_lectionary().items():
+            for key, value in day.items():
+                if key.startswith("Year "):
+                    assert self.lectionary.get_lessons(name, key) == freeze(
+                        value
+                    )
+                    rows += 1
+                else:
+                    for year, lessons in value.items():
+                        assert self.lectionary.get_lessons(
+                            name, year, key
+                        ) == freeze(lessons)
+                        rows += 1
+        assert rows == len(list(self.lectionary.iter_lessons()))
+
+    def test_service(self):
+        lessons = self.lectionary.get_lessons("Christmas Day", "Year A", "II")
+        assert lessons["Gospel"] == ("Luke 2:(1-14), 15-20",)
+
+    def test_missing_service(self):
+        with pytest.raises(ValueError):
+            self.lectionary.get_lessons("Christmas Day", "Year A")
+
+    def test_unknown_day(self):
+        with pytest.raises(ValueError):
+            self.lectionary.get_lessons("Not a Holy Day", "Year A")
+
+
+class TestLoadCompiledLectionary:
+    def test_writes_cache(self, tmp_path):
+        path = tmp_path / "lectionary.marshal"
+        compiled = load_compiled_lectionary(path)
+        assert path.is_file()
+
+        cached = load_compiled_lectionary(path)
+        assert cached.to_tuple() == compiled.to_tuple()
+
+    def test_reads_cache(self, tmp_path):
+        path = tmp_path / "lectionary.marshal"
+        load_compiled_lectionary(path)
+        with open(path, "rb") as f:
+            version, digest, tables = marshal.load(f)
+
+        # A cache with the right hash is used without parsing the JSON.
+        days = ("Only Day",)
+        tables = (days, ((None,),), (0,), ({}, {}, {}))
+        with open(path, "wb") as f:
+            marshal.dump((version, digest, tables), f)
+        assert load_compiled_lectionary(path).days == days
+
+    def test_recompiles_when_source_changes(self, tmp_path):
+        path = tmp_path / "lectionary.marshal"
+        source = tmp_path / "lectionary.json"
+        source.write_text('{"Day": {"Year A": {}, "Year B": {}}}')
+        assert load_compiled_lectionary(path, source).days == ("Day",)
+
+        source.write_text('{"Other Day": {"Year C": {}}}')
+        assert load_compiled_lectionary(path, source).days == ("Other Day",)
+
+    def test_corrupt_cache(self, tmp_path):
+        path = tmp_path / "lectionary.marshal"
+        path.write_bytes(b"not marshal data")
+        assert isinstance(load_compiled_lectionary(path), CompiledLectionary)
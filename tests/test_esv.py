@@ -0,0 +1,266 @@
+# pylint: skip-file
+
+import threading
+
+import pytest
+import requests
+
+import pylect.esv
+from pylect.esv import (
+    MissingApiKeyError,
+    get_api_key,
+    get_esv_text,
+    get_esv_texts,
+)
+
+
+class FakeResponse:
+    def __init__(self, status_code, data=None, headers=None):
+        self.status_code = status_code
+        self.data = data or {}
+        self.headers = headers or {}
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    """Returns one passage for each semicolon-separated reference, leaving
+    out any reference in missing. Queued responses or exceptions are used
+    first, and requests wait for blocked to be set if it is given."""
+
+    def __init__(self):
+        self.queries = []
+        self.missing = set()
+        self.responses = []
+        self.blocked = None
+
+    def get(self, url, params, timeout):
+        self.queries.append(params["q"])
+        if self.blocked is not None:
+            self.blocked.wait(5)
+        if self.responses:
+            response = self.responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+        refs = [ref.strip() for ref in params["q"].split(";")]
+        return FakeResponse(
+            200,
+            {
+                "passages": [
+                    f"[{ref}]\n\n  Text of {ref}."
+                    for ref in refs
+                    if ref not in self.missing
+                ]
+            },
+        )
+
+
+def text(ref):
+    return f"{ref}\n\n  Text of {ref}."
+
+
+def clear_caches():
+    pylect.esv.get_revalidator().shutdown()
+    pylect.esv.get_revalidator.cache_clear()
+    pylect.esv.get_passage_cache.cache_clear()
+    pylect.esv.get_circuit_breaker.cache_clear()
+    pylect.esv.get_rate_limiter.cache_clear()
+
+
+@pytest.fixture
+def session(monkeypatch, tmp_path):
+    monkeypatch.setenv("PYLECT_CACHE_DIR", str(tmp_path))
+    clear_caches()
+    session = FakeSession()
+    monkeypatch.setattr(pylect.esv, "get_session", lambda: session)
+    yield session
+    clear_caches()
+
+
+class TestPassageCache:
+    def test_cached(self, session):
+        assert get_esv_text("John 3:16") == text("John 3:16")
+        assert get_esv_text("John 3:16") == text("John 3:16")
+        assert session.queries == ["John 3:16"]
+
+    def test_unusable_cache_dir(self, session, monkeypatch, tmp_path):
+        not_a_dir = tmp_path / "file"
+        not_a_dir.write_text("")
+        monkeypatch.setenv("PYLECT_CACHE_DIR", str(not_a_dir))
+        pylect.esv.get_passage_cache.cache_clear()
+
+        assert get_esv_texts(["John 3:16"]) == [text("John 3:16")]
+        assert get_esv_texts(["John 3:16"]) == [text("John 3:16")]
+        assert session.queries == ["John 3:16", "John 3:16"]
+
+
+class TestGetEsvTexts:
+    def test_batched_in_order(self, session):
+        refs = ["John 3:16", "Mark 1:1", "Romans 8:28"]
+        assert get_esv_texts(refs) == [text(ref) for ref in refs]
+        assert session.queries == ["John 3:16; Mark 1:1; Romans 8:28"]
+
+    def test_duplicates_fetched_once(self, session):
+        refs = ["John 3:16", "Mark 1:1", "John 3:16"]
+        assert get_esv_texts(refs) == [text(ref) for ref in refs]
+        assert session.queries == ["John 3:16; Mark 1:1"]
+
+    def test_cached_not_fetched(self, session):
+        get_esv_text("Mark 1:1")
+        refs = ["John 3:16", "Mark 1:1", "Romans 8:28"]
+        assert get_esv_texts(refs) == [text(ref) for ref in refs]
+        assert session.queries == ["Mark 1:1", "John 3:16; Romans 8:28"]
+        assert get_esv_texts(refs) == [text(ref) for ref in refs]
+        assert len(session.queries) == 2
+
+    def test_multiple_ranges_sent_alone(self, session):
+        refs = ["John 3:16", "Luke 2:1-14, (15-20)", "Mark 1:1"]
+        assert get_esv_texts(refs) == [text(ref) for ref in refs]
+        assert sorted(session.queries) == [
+            "John 3:16; Mark 1:1",
+            "Luke 2:1-14, (15-20)",
+        ]
+
+    def test_batches_fetched_concurrently(self, session, monkeypatch):
+        monkeypatch.setattr(pylect.esv, "MAX_BATCH_SIZE", 2)
+        refs = [f"Psalm {i}" for i in range(1, 8)]
+        assert get_esv_texts(refs) == [text(ref) for ref in refs]
+        assert sorted(session.queries) == [
+            "Psalm 1; Psalm 2",
+            "Psalm 3; Psalm 4",
+            "Psalm 5; Psalm 6",
+            "Psalm 7",
+        ]
+
+    def test_count_mismatch_falls_back(self, session):
+        session.missing.add("Mark 99:1")
+        refs = ["John 3:16", "Mark 99:1", "Romans 8:28"]
+        with pytest.raises(ValueError):
+            get_esv_texts(refs)
+        assert session.queries[0] == "John 3:16; Mark 99:1; Romans 8:28"
+        assert session.queries[1:] == ["John 3:16", "Mark 99:1"]
+
+        # Passages found one at a time were still cached.
+        session.missing.clear()
+        assert get_esv_texts(refs) == [text(ref) for ref in refs]
+        assert session.queries[3:] == ["Mark 99:1; Romans 8:28"]
+
+
+class TestRequest:
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(pylect.esv.time, "sleep", sleeps.append)
+        monkeypatch.setattr(pylect.esv, "BACKOFF_BASE", 0.01)
+        return sleeps
+
+    def test_retry_server_errors(self, session, sleeps):
+        session.responses = [
+            FakeResponse(503),
+            requests.ConnectionError(),
+            FakeResponse(500),
+        ]
+        assert get_esv_text("John 3:16") == text("John 3:16")
+        assert len(session.queries) == 4
+        assert len(sleeps) == 3
+        assert all(0 <= s <= 0.01 * 2**i for i, s in enumerate(sleeps))
+
+    def test_give_up_after_retries(self, session, sleeps):
+        session.responses = [
+            FakeResponse(503) for _ in range(pylect.esv.MAX_RETRIES + 1)
+        ]
+        with pytest.raises(ValueError):
+            get_esv_text("John 3:16")
+        assert len(session.queries) == pylect.esv.MAX_RETRIES + 1
+
+    def test_open_circuit_fails_fast(self, session, sleeps):
+        breaker = pylect.esv.get_circuit_breaker()
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+        with pytest.raises(ValueError):
+            get_esv_text("John 3:16")
+        assert session.queries == []
+        assert sleeps == []
+
+    def test_throttled_pauses(self, session, sleeps, monkeypatch):
+        pauses = []
+        monkeypatch.setattr(
+            pylect.esv.get_rate_limiter(), "pause", pauses.append
+        )
+        session.responses = [FakeResponse(429, headers={"Retry-After": "7"})]
+        assert get_esv_text("John 3:16") == text("John 3:16")
+        assert pauses == [7.0]
+        assert len(session.queries) == 2
+        assert sleeps == []
+
+
+def wait_for_revalidation():
+    # The revalidator has one worker, so this runs after every queued job.
+    pylect.esv.get_revalidator().submit(lambda: None).result(timeout=5)
+
+
+class TestRevalidate:
+    def test_stale_served_and_refreshed_once(self, session, monkeypatch):
+        get_esv_text("John 3:16")
+        monkeypatch.setattr(pylect.esv, "REVALIDATE_AFTER", -1)
+        session.blocked = threading.Event()
+
+        assert get_esv_text("John 3:16") == text("John 3:16")
+        assert get_esv_text("John 3:16") == text("John 3:16")
+        session.blocked.set()
+        wait_for_revalidation()
+
+        assert not pylect.esv._revalidating
+        assert session.queries == ["John 3:16", "John 3:16"]
+
+    def test_stale_refreshed_in_batches(self, session, monkeypatch):
+        refs = [f"Psalm {i}" for i in range(1, 21)]
+        get_esv_texts(refs)
+        assert len(session.queries) == 2
+        monkeypatch.setattr(pylect.esv, "REVALIDATE_AFTER", -1)
+
+        assert get_esv_texts(refs) == [text(ref) for ref in refs]
+        wait_for_revalidation()
+        assert session.queries[2:] == session.queries[:2]
+
+    def test_failed_refresh_keeps_cache(self, session, monkeypatch):
+        get_esv_text("John 3:16")
+        monkeypatch.setattr(pylect.esv, "REVALIDATE_AFTER", -1)
+        monkeypatch.setattr(pylect.esv, "MAX_RETRIES", 0)
+        session.responses = [FakeResponse(503)]
+
+        pylect.esv._revalidate(["John 3:16"])
+        assert len(session.queries) == 2
+        assert not pylect.esv._revalidating
+        assert pylect.esv.get_passage_cache().get(
+            "John 3:16", pylect.esv.API_OPTIONS
+        ) == text("John 3:16")
+
+    def test_fresh_not_refreshed(self, session):
+        get_esv_text("John 3:16")
+        get_esv_text("John 3:16")
+        wait_for_revalidation()
+        assert session.queries == ["John 3:16"]
+
+
+class TestApiKey:
+    @pytest.fixture
+    def no_key(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("PYLECT_CACHE_DIR", str(tmp_path))
+        monkeypatch.delenv("ESV_API_KEY", raising=False)
+        monkeypatch.setattr(pylect.esv, "load_dotenv", lambda: None)
+        pylect.esv.get_api_key.cache_clear()
+        clear_caches()
+        yield
+        pylect.esv.get_api_key.cache_clear()
+        clear_caches()
+
+    def test_missing_key_raises(self, no_key):
+        with pytest.raises(MissingApiKeyError):
+            get_api_key()
+
+    def test_missing_key_from_lookup(self, no_key):
+        with pytest.raises(MissingApiKeyError):
+            get_esv_texts(["John 3:16", "Luke 2:1-14, (15-20)"])
@@ -0,0 +1,86 @@
+# pylint: skip-file
+
+from datetime import date
+
+import pytest
+
+import pylect.export
+from pylect.export import export_bulletins
+
+
+@pytest.fixture
+def fetched(monkeypatch):
+    fetched = []
+
+    def get_esv_texts(queries):
+        fetched.append(list(queries))
+        return [
+            f"{query}\n\n  [1] Text of {query}.\n  Second line."
+            for query in queries
+        ]
+
+    monkeypatch.setattr(pylect.export, "get_esv_texts", get_esv_texts)
+    return fetched
+
+
+class TestExportBulletins:
+    def test_one_file_per_holy_day(self, tmp_path, fetched):
+        paths = export_bulletins(
+            date(2024, 12, 24), date(2024, 12, 29), tmp_path
+        )
+        assert [path.name for path in paths] == [
+            "2024-12-25-christmas-day.txt",
+            "2024-12-26-saint-stephen.txt",
+            "2024-12-27-saint-john.txt",
+            "2024-12-28-holy-innocents.txt",
+            "2024-12-29-first-sunday-after-christmas.txt",
+        ]
+        assert sorted(tmp_path.iterdir()) == sorted(paths)
+
+    def test_fetched_once(self, tmp_path, fetched):
+        export_bulletins(date(2024, 12, 1), date(2025, 2, 28), tmp_path)
+        assert len(fetched) == 1
+        assert len(fetched[0]) == len(set(fetched[0]))
+        assert not any(query.startswith("Psalm") for query in fetched[0])
+
+    def test_plain(self, tmp_path, fetched):
+        (path,) = export_bulletins(
+            date(2024, 12, 25), date(2024, 12, 25), tmp_path
+        )
+        text = path.read_text()
+        assert text.startswith(
+            "Christmas Day\n\nWednesday, December 25, 2024\n\nFirst Lesson"
+        )
+        assert "Text of Luke 2:1-14, (15-20)." in text
+        assert "Psalm 96\n\nCantate Domino" in text
+
+    def test_markdown(self, tmp_path, fetched):
+        (path,) = export_bulletins(
+            date(2024, 12, 25), date(2024, 12, 25), tmp_path, "markdown"
+        )
+        text = path.read_text()
+        assert path.suffix == ".md"
+        assert text.startswith("# Christmas Day\n\n*Wednesday")
+        assert "## Gospel" in text
+        assert "[1] Text of Luke 2:1-14, (15-20).  \nSecond line." in text
+        assert "### Psalm 96" in text
+
+    def test_html(self, tmp_path, fetched):
+        (path,) = export_bulletins(
+            date(2024, 12, 25), date(2024, 12, 25), tmp_path, "html"
+        )
+        text = path.read_text()
+        assert path.suffix == ".html"
+        assert "<h1>Christmas Day</h1>" in text
+        assert '<div class="psalm">' in text
+        assert (
+            "<p>[1] Text of Luke 2:1-14, (15-20).<br>\nSecond line.</p>"
+            in text
+        )
+
+    def test_unknown_format(self, tmp_path, fetched):
+        with pytest.raises(ValueError):
+            export_bulletins(
+                date(2024, 12, 25), date(2024, 12, 25), tmp_path, "pdf"
+            )
+        assert fetched == []
@@ -0,0 +1,43 @@
+# pylint: skip-file
+
+import io
+from datetime import date
+
+from pylect.generate import HEADER, generate, generate_year
+from pylect.lectionary import Lectionary
+
+
+class TestGenerateYear:
+    def test_every_day(self):
+        lines = generate_year(2024).splitlines()
+        assert len(lines) == 366
+        assert lines[0].startswith("2024-01-01\t")
+        assert lines[-1].startswith("2024-12-31\t")
+
+    def test_matches_lectionary(self):
+        for line in generate_year(2024).splitlines():
+            fields = line.split("\t")
+            lectionary = Lectionary(date.fromisoformat(fields[0]))
+            assert fields[1] == lectionary.liturgical_year
+            assert fields[2] == lectionary.liturgical_season
+            names = [day.name for day in lectionary.holy_days]
+            assert fields[4] == "; ".join(names)
+
+    def test_transferred(self):
+        lines = generate_year(2024).splitlines()
+        sunday = lines[date(2024, 9, 29).timetuple().tm_yday - 1]
+        monday = lines[date(2024, 9, 30).timetuple().tm_yday - 1]
+        assert sunday.split("\t")[3] == "Proper 21"
+        assert monday.split("\t")[3] == "Saint Michael and All Angels"
+
+
+class TestGenerate:
+    def test_in_order(self):
+        output = io.StringIO()
+        days = generate(1999, 2004, output, workers=3)
+        text = output.getvalue()
+        assert text.startswith(HEADER)
+        assert days == len(text.splitlines()) - 1 == 2192
+        assert text == HEADER + "".join(
+            generate_year(year) for year in range(1999, 2005)
+        )
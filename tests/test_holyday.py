@@ -0,0 +1,61 @@
+# pylint: skip-file
+
+import pickle
+from datetime import date
+
+import pytest
+
+from pylect.compiledlectionary import get_compiled_lectionary
+from pylect.constants import Rank
+from pylect.holyday import HolyDay
+from pylect.lectionary import Lectionary, iter_holy_days
+
+
+class TestHolyDay:
+    def test_interned(self):
+        first = HolyDay("Proper 21", "Year B", "Pentecost", Rank.SUNDAY)
+        second = HolyDay("Proper 21", "Year B", "Pentecost", Rank.SUNDAY)
+        assert first is second
+        assert first is not HolyDay(
+            "Proper 21", "Year C", "Pentecost", Rank.SUNDAY
+        )
+
+    def test_shared_across_years(self):
+        holy_days = [
+            day
+            for _, day in iter_holy_days(date(2000, 1, 1), date(2099, 12, 31))
+        ]
+        assert len(holy_days) > 10000
+        assert len({id(day) for day in holy_days}) < 500
+
+    def test_immutable(self):
+        day = HolyDay("Proper 21", "Year B", "Pentecost", Rank.SUNDAY)
+        with pytest.raises(AttributeError):
+            day.name = "Proper 22"
+        with pytest.raises(AttributeError):
+            day.other = None
+        with pytest.raises(TypeError):
+            day.lessons["Gospel"] = []
+
+    def test_lessons_immutable(self):
+        day = HolyDay("Proper 21", "Year B", "Pentecost", Rank.SUNDAY)
+        with pytest.raises(AttributeError):
+            day.lessons["Gospel"].append("John 3:16")
+        assert get_compiled_lectionary().get_lessons("Proper 21", "Year B")[
+            "Gospel"
+        ] == ("Mark 9:38-48",)
+
+    def test_pickle(self):
+        day = HolyDay("Proper 21", "Year B", "Pentecost", Rank.SUNDAY)
+        assert pickle.loads(pickle.dumps(day)) is day
+
+    def test_lessons(self):
+        day = HolyDay("Proper 21", "Year B", "Pentecost", Rank.SUNDAY)
+        assert day.lessons["Gospel"] == ("Mark 9:38-48",)
+
+    def test_principal_service_lessons(self):
+        christmas = Lectionary(date(2024, 12, 25)).holy_days[0]
+        assert christmas.lessons["Gospel"] == ("Luke 2:1-14, (15-20)",)
+        easter = Lectionary(date(2024, 3, 31)).holy_days[0]
+        assert easter.name == "Easter Day"
+        assert "Gospel" in easter.lessons
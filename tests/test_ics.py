@@ -0,0 +1,174 @@
+# pylint: skip-file
+
+import io
+from datetime import date
+
+import pytest
+
+from pylect.cli import check_lectionary, write_records
+from pylect.constants import Rank
+from pylect.holyday import HolyDay
+from pylect.ics import (
+    MAX_LINE_OCTETS,
+    _escape,
+    _fold,
+    get_stamp,
+    get_uid,
+    iter_ics_lines,
+    write_ics,
+)
+
+
+def get_ics(start_date, end_date):
+    output = io.StringIO(newline="")
+    write_ics(check_lectionary(start_date, end_date), output)
+    return output.getvalue()
+
+
+class TestIterIcsLines:
+    def test_calendar(self):
+        lines = list(iter_ics_lines([], name="Parish Calendar"))
+        assert lines == [
+            "BEGIN:VCALENDAR\r\n",
+            "VERSION:2.0\r\n",
+            "PRODID:-//Pylect//Anglican Lectionary//EN\r\n",
+            "CALSCALE:GREGORIAN\r\n",
+            "X-WR-CALNAME:Parish Calendar\r\n",
+            "END:VCALENDAR\r\n",
+        ]
+
+    def test_event(self):
+        text = get_ics(date(2024, 12, 25), date(2024, 12, 25))
+        unfolded = text.replace("\r\n ", "")
+        assert "UID:20241225-christmas-day@pylect\r\n" in unfolded
+        assert "DTSTART;VALUE=DATE:20241225\r\n" in unfolded
+        assert "DTEND;VALUE=DATE:20241226\r\n" in unfolded
+        assert "SUMMARY:Christmas Day\r\n" in unfolded
+        assert (
+            "DESCRIPTION:Christmas\\, Year C\\n\\nFirst Lesson: Isaiah 9:1-7"
+            "\\nPsalm: Psalm 96\\nSecond Lesson: Titus 2:11-14"
+            "\\nGospel: Luke 2:1-14\\, (15-20)\r\n"
+        ) in unfolded
+
+    def test_alternative_lessons(self):
+        # Ash Wednesday offers a choice of first lesson.
+        text = get_ics(date(2025, 3, 5), date(2025, 3, 5))
+        assert " or " in text.replace("\r\n ", "")
+
+    def test_one_event_per_holy_day(self):
+        start_date, end_date = date(2024, 1, 1), date(2026, 12, 31)
+        text = get_ics(start_date, end_date)
+        days = list(check_lectionary(start_date, end_date))
+        assert text.count("BEGIN:VEVENT\r\n") == len(days)
+        assert text.count("END:VEVENT\r\n") == len(days)
+
+    def test_line_endings(self):
+        text = get_ics(date(2024, 1, 1), date(2024, 12, 31))
+        assert text.endswith("END:VCALENDAR\r\n")
+        assert text.count("\n") == text.count("\r\n")
+
+    def test_streams(self):
+        def holy_days():
+            yield from check_lectionary(date(2024, 12, 25), date(2024, 12, 25))
+            raise RuntimeError
+
+        lines = iter_ics_lines(holy_days())
+        seen = []
+        with pytest.raises(RuntimeError):
+            for line in lines:
+                seen.append(line)
+        assert "END:VEVENT\r\n" in seen
+
+
+class TestStableOutput:
+    def test_regenerated_feed_is_identical(self):
+        first = get_ics(date(2024, 1, 1), date(2025, 12, 31))
+        second = get_ics(date(2024, 1, 1), date(2025, 12, 31))
+        assert first == second
+
+    def test_overlapping_ranges_share_events(self):
+        # Extending a feed leaves the events it already had unchanged.
+        short = get_ics(date(2024, 1, 1), date(2024, 6, 30))
+        long = get_ics(date(2024, 1, 1), date(2024, 12, 31))
+        events = short.split("END:VCALENDAR")[0].split("BEGIN:VEVENT")[1:]
+        assert events and all(event in long for event in events)
+
+    def test_uid(self):
+        day = HolyDay(
+            "Saint Mary the Virgin", "Year B", "Pentecost", Rank.MAJOR
+        )
+        assert (
+            get_uid(date(2024, 8, 15), day)
+            == "20240815-saint-mary-the-virgin@pylect"
+        )
+
+    def test_uids_are_unique(self):
+        text = get_ics(date(2024, 1, 1), date(2030, 12, 31))
+        uids = [line for line in text.splitlines() if line.startswith("UID:")]
+        assert len(uids) == len(set(uids))
+
+
+class TestStamp:
+    def test_event_stamps(self):
+        text = get_ics(date(2030, 12, 25), date(2030, 12, 25))
+        (stamp,) = [
+            line[len("DTSTAMP:") :]
+            for line in text.splitlines()
+            if line.startswith("DTSTAMP:")
+        ]
+        assert f"LAST-MODIFIED:{stamp}\r\n" in text
+        assert "20000101T000000Z" <= stamp < "20250101T000000Z"
+
+    def test_same_content(self):
+        content = ["SUMMARY:Easter Day", "DESCRIPTION:Gospel: John 20:1-10"]
+        assert get_stamp(content) == get_stamp(list(content))
+
+    def test_changed_content(self):
+        content = ["SUMMARY:Easter Day", "DESCRIPTION:Gospel: John 20:1-10"]
+        changed = ["SUMMARY:Easter Day", "DESCRIPTION:Gospel: John 20:1-18"]
+        assert get_stamp(content) != get_stamp(changed)
+
+    def test_stamps_differ_between_events(self):
+        text = get_ics(date(2024, 1, 1), date(2024, 12, 31))
+        stamps = [
+            line for line in text.splitlines() if line.startswith("DTSTAMP:")
+        ]
+        assert len(set(stamps)) > len(stamps) // 2
+
+
+class TestFold:
+    def test_short_line(self):
+        assert list(_fold("SUMMARY:Easter Day")) == ["SUMMARY:Easter Day\r\n"]
+
+    def test_ascii(self):
+        line = "DESCRIPTION:" + "x" * 200
+        folded = list(_fold(line))
+        assert all(
+            len(part.encode()) <= MAX_LINE_OCTETS + 2 for part in folded
+        )
+        assert all(part.startswith(" ") for part in folded[1:])
+        assert "".join(folded).replace("\r\n ", "") == line + "\r\n"
+
+    def test_multibyte(self):
+        line = "DESCRIPTION:" + "é" * 100
+        folded = list(_fold(line))
+        # No part is split in the middle of a character.
+        assert all(
+            len(part.encode()) <= MAX_LINE_OCTETS + 2 for part in folded
+        )
+        assert "".join(folded).replace("\r\n ", "") == line + "\r\n"
+
+
+class TestEscape:
+    def test_escape(self):
+        assert _escape("a\\b;c,d\ne") == "a\\\\b\\;c\\,d\\ne"
+
+
+class TestWriteRecords:
+    def test_ics(self):
+        output = io.StringIO(newline="")
+        holy_days = check_lectionary(date(2024, 12, 24), date(2024, 12, 26))
+        write_records(holy_days, output, "ics")
+        text = output.getvalue()
+        assert text.startswith("BEGIN:VCALENDAR\r\n")
+        assert text.count("BEGIN:VEVENT") == 2
@@ -1,8 +1,11 @@
 # pylint: skip-file
 
 from datetime import date
+from itertools import islice
 
-from pylect.lectionary import Lectionary
+import pytest
+
+from pylect.lectionary import Lectionary, iter_holy_days, occurrences
 
 
 class TestMoveableDates:
@@ -38,3 +41,54 @@ class TestMoveableDates:
             "advent_sunday": date(2024, 12, 1),
         }
         assert lectionary.moveable_dates == expect
+
+
+class TestIterHolyDays:
+    def test_closed_range(self):
+        days = [
+            (d, h.name)
+            for d, h in iter_holy_days(date(2024, 12, 24), date(2024, 12, 29))
+        ]
+        expect = [
+            (date(2024, 12, 25), "Christmas Day"),
+            (date(2024, 12, 26), "Saint Stephen"),
+            (date(2024, 12, 27), "Saint John"),
+            (date(2024, 12, 28), "Holy Innocents"),
+            (date(2024, 12, 29), "First Sunday after Christmas"),
+        ]
+        assert days == expect
+
+    def test_open_range(self):
+        """Tests that an open-ended range can be consumed lazily."""
+        days = list(islice(iter_holy_days(date(2024, 12, 30)), 2))
+        assert [(d, h.name) for d, h in days] == [
+            (date(2025, 1, 1), "Holy Name"),
+            (date(2025, 1, 5), "Second Sunday after Christmas"),
+        ]
+
+
+class TestOccurrences:
+    @pytest.mark.parametrize(
+        "day_name",
+        [
+            "Proper 1",
+            "Proper 17",
+            "Fourth Sunday after Epiphany",
+            "Eighth Sunday after Epiphany",
+            "First Sunday after Christmas",
+            "Second Sunday after Christmas",
+            "Easter Day",
+            "Saint Mark",
+        ],
+    )
+    def test_matches_scan(self, day_name):
+        """Tests that the computed dates match a day-by-day scan."""
+        start, end = date(2020, 1, 1), date(2035, 12, 31)
+        expect = [
+            d for d, h in iter_holy_days(start, end) if h.name == day_name
+        ]
+        assert occurrences(day_name, 2020, 2035) == expect
+
+    def test_unknown_day(self):
+        with pytest.raises(ValueError):
+            occurrences("Proper 30", 2024, 2025)
@@ -0,0 +1,92 @@
+# pylint: skip-file
+
+from datetime import date, timedelta
+
+import pytest
+
+from pylect.constants import Rank
+from pylect.lectionary import Lectionary
+from pylect.liturgicalyear import LiturgicalYear, get_liturgical_year
+from pylect.observances import RULES, Calendar, FixedRule
+
+
+def summarize(holy_days):
+    return [(d.name, d.year, d.season, d.rank) for d in holy_days]
+
+
+class TestLiturgicalYear:
+    @pytest.mark.parametrize("year", [2022, 2023, 2024, 2038, 2285])
+    def test_matches_lectionary(self, year):
+        """Tests that every date in the year agrees with Lectionary."""
+        liturgical_year = LiturgicalYear(year)
+        this_date = date(year, 1, 1)
+        while this_date.year == year:
+            lectionary = Lectionary(this_date)
+            assert summarize(
+                liturgical_year.get_holy_days(this_date)
+            ) == summarize(lectionary.holy_days)
+            assert (
+                liturgical_year.get_liturgical_year(this_date)
+                == lectionary.liturgical_year
+            )
+            assert (
+                liturgical_year.get_liturgical_season(this_date)
+                == lectionary.liturgical_season
+            )
+            this_date += timedelta(days=1)
+
+    def test_wrong_year(self):
+        with pytest.raises(ValueError):
+            LiturgicalYear(2024).get_holy_days(date(2025, 1, 1))
+
+    def test_cached(self):
+        assert get_liturgical_year(2024) is get_liturgical_year(2024)
+
+    def test_other_calendar(self):
+        calendar = Calendar(
+            RULES + (FixedRule("Saint Patrick", Rank.MINOR, 3, 17),)
+        )
+        this_date = date(2025, 3, 17)
+        expect = [("Saint Patrick", "Year C", "Lent", Rank.MINOR)]
+        assert summarize(Lectionary(this_date, calendar).holy_days) == expect
+        liturgical_year = LiturgicalYear(2025, calendar)
+        assert summarize(liturgical_year.get_holy_days(this_date)) == expect
+        assert Lectionary(this_date).holy_days == []
+
+
+class TestObserved:
+    liturgical_year = LiturgicalYear(2024)
+
+    def test_single_holy_day(self):
+        observed = self.liturgical_year.get_observed(date(2024, 12, 25))
+        assert observed.name == "Christmas Day"
+
+    def test_no_holy_day(self):
+        assert self.liturgical_year.get_observed(date(2024, 7, 2)) is None
+
+    def test_sunday_not_transferred(self):
+        """Trinity Sunday outranks Proper 3 on the same day."""
+        observed = self.liturgical_year.get_observed(date(2024, 5, 26))
+        assert observed.name == "Trinity Sunday"
+        names = [d.name for d in self.liturgical_year.observed if d]
+        assert "Proper 3" not in names
+
+    def test_transfer_to_next_free_day(self):
+        """Saint Michael and All Angels fell on a Sunday in 2024."""
+        sunday = self.liturgical_year.get_observed(date(2024, 9, 29))
+        assert sunday.name == "Proper 21"
+        monday = self.liturgical_year.get_observed(date(2024, 9, 30))
+        assert monday.name == "Saint Michael and All Angels"
+
+    def test_transfer_out_of_holy_week(self):
+        """The Annunciation fell on Monday in Holy Week in 2024 and is
+        transferred past Easter Week and the Second Sunday of Easter."""
+        liturgical_year = self.liturgical_year
+        assert (
+            liturgical_year.get_observed(date(2024, 3, 25)).name
+            == "Monday in Holy Week"
+        )
+        assert (
+            liturgical_year.get_observed(date(2024, 4, 8)).name
+            == "The Annunciation"
+        )
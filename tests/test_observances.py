@@ -0,0 +1,108 @@
+# pylint: skip-file
+
+from datetime import date
+
+import pytest
+
+from pylect.constants import Rank
+from pylect.observances import (
+    CALENDAR,
+    RULES,
+    Calendar,
+    FixedRule,
+    MoveableRule,
+    get_anchors,
+    get_moveable_dates,
+    get_year_anchors,
+)
+
+
+def names(calendar, this_date):
+    anchors = get_anchors(this_date.year)
+    return [rule.name for rule in calendar.get_rules(this_date, anchors)]
+
+
+class TestCalendar:
+    def test_precedence_order(self):
+        assert names(CALENDAR, date(2024, 5, 26)) == [
+            "Trinity Sunday",
+            "Proper 3",
+        ]
+
+    def test_sundays_only(self):
+        assert names(CALENDAR, date(2024, 12, 29)) == [
+            "First Sunday after Christmas"
+        ]
+        assert names(CALENDAR, date(2024, 12, 30)) == []
+
+    def test_window_end(self):
+        # Easter 2024 is March 31, so there are only six Sundays after
+        # Epiphany before the Second to Last Sunday.
+        assert names(CALENDAR, date(2024, 2, 4)) == [
+            "Second to Last Sunday after Epiphany"
+        ]
+        assert (
+            CALENDAR.get_dates(
+                "Sixth Sunday after Epiphany", 2024, get_anchors(2024)
+            )
+            == []
+        )
+
+    def test_window_start(self):
+        assert CALENDAR.get_dates("Proper 1", 2024, get_anchors(2024)) == []
+        assert CALENDAR.get_dates("Proper 4", 2024, get_anchors(2024)) == [
+            date(2024, 6, 2)
+        ]
+
+    def test_unknown_day(self):
+        with pytest.raises(ValueError):
+            CALENDAR.get_dates("Proper 30", 2024, get_anchors(2024))
+
+    def test_extra_rules(self):
+        calendar = Calendar(
+            RULES
+            + (
+                FixedRule("Saint Patrick", Rank.MINOR, 3, 17),
+                MoveableRule("Rogation Monday", Rank.MINOR, "easter_day", 36),
+                FixedRule("Leap Day", Rank.MINOR, 2, 29),
+            )
+        )
+        assert names(calendar, date(2024, 3, 17)) == [
+            "Fifth Sunday in Lent",
+            "Saint Patrick",
+        ]
+        assert names(calendar, date(2024, 5, 6)) == ["Rogation Monday"]
+        assert calendar.get_dates("Leap Day", 2023, get_anchors(2023)) == []
+        assert names(CALENDAR, date(2024, 3, 17)) == ["Fifth Sunday in Lent"]
+
+
+class TestYearAnchors:
+    anchors = get_year_anchors(2024)
+
+    @pytest.mark.parametrize(
+        "this_date, season",
+        [
+            (date(2024, 1, 5), "Christmas"),
+            (date(2024, 1, 6), "Epiphany"),
+            (date(2024, 2, 13), "Epiphany"),
+            (date(2024, 2, 14), "Lent"),
+            (date(2024, 3, 31), "Easter"),
+            (date(2024, 5, 19), "Pentecost"),
+            (date(2024, 11, 30), "Pentecost"),
+            (date(2024, 12, 1), "Advent"),
+            (date(2024, 12, 25), "Christmas"),
+        ],
+    )
+    def test_season(self, this_date, season):
+        assert self.anchors.get_liturgical_season(this_date) == season
+
+    def test_liturgical_year(self):
+        assert self.anchors.get_liturgical_year(date(2024, 11, 30)) == "Year B"
+        assert self.anchors.get_liturgical_year(date(2024, 12, 1)) == "Year C"
+
+    def test_cached(self):
+        assert get_year_anchors(2024) is self.anchors
+
+    def test_moveable_dates_are_copied(self):
+        get_moveable_dates(2024)["easter_day"] = None
+        assert self.anchors.moveable_dates["easter_day"] == date(2024, 3, 31)
@@ -0,0 +1,78 @@
+# pylint: skip-file
+
+from pylect.passagecache import PassageCache
+
+OPTIONS = {"include-verse-numbers": True}
+
+
+class TestPassageCache:
+    def test_round_trip(self, tmp_path):
+        cache = PassageCache(tmp_path / "passages.sqlite3")
+        assert cache.get("John 3:16", OPTIONS) is None
+        cache.set("John 3:16", OPTIONS, "For God so loved the world")
+        assert cache.get("John 3:16", OPTIONS) == "For God so loved the world"
+
+    def test_normalized_query(self, tmp_path):
+        cache = PassageCache(tmp_path / "passages.sqlite3")
+        cache.set("John 3:16", OPTIONS, "text")
+        assert cache.get("  john   3:16 ", OPTIONS) == "text"
+
+    def test_params_in_key(self, tmp_path):
+        cache = PassageCache(tmp_path / "passages.sqlite3")
+        cache.set("John 3:16", OPTIONS, "text")
+        assert cache.get("John 3:16", {"include-verse-numbers": False}) is None
+
+    def test_expired(self, tmp_path):
+        cache = PassageCache(tmp_path / "passages.sqlite3", max_age=-1)
+        cache.set("John 3:16", OPTIONS, "text")
+        assert cache.get("John 3:16", OPTIONS) is None
+
+    def test_stale_with_age(self, tmp_path):
+        PassageCache(tmp_path / "passages.sqlite3").set(
+            "John 3:16", OPTIONS, "text"
+        )
+        cache = PassageCache(tmp_path / "passages.sqlite3", max_age=-1)
+        assert cache.get("John 3:16", OPTIONS) is None
+        text, age = cache.get_with_age("John 3:16", OPTIONS)
+        assert text == "text"
+        assert age >= 0
+
+    def test_evict_least_recently_used(self, tmp_path):
+        cache = PassageCache(tmp_path / "passages.sqlite3", max_entries=2)
+        cache.set("John 3:16", OPTIONS, "a")
+        cache.set("John 3:17", OPTIONS, "b")
+        cache.get("John 3:16", OPTIONS)
+        cache.set("John 3:18", OPTIONS, "c")
+        assert cache.get("John 3:16", OPTIONS) == "a"
+        assert cache.get("John 3:17", OPTIONS) is None
+        assert cache.info()["entries"] == 2
+
+    def test_clear(self, tmp_path):
+        cache = PassageCache(tmp_path / "passages.sqlite3")
+        cache.set("John 3:16", OPTIONS, "text")
+        cache.clear()
+        assert cache.info()["entries"] == 0
+
+    def test_get_many(self, tmp_path):
+        cache = PassageCache(tmp_path / "passages.sqlite3")
+        cache.set("John 3:16", OPTIONS, "a")
+        cache.set("John 3:17", OPTIONS, "b")
+        found = cache.get_many(
+            ["John 3:17", "John 3:18", "john 3:16"], OPTIONS
+        )
+        assert {query: text for query, (text, _) in found.items()} == {
+            "John 3:17": "b",
+            "john 3:16": "a",
+        }
+
+    def test_read_times_saved_on_flush(self, tmp_path):
+        cache = PassageCache(tmp_path / "passages.sqlite3", max_entries=2)
+        cache.set("John 3:16", OPTIONS, "a")
+        cache.set("John 3:17", OPTIONS, "b")
+        cache.get("John 3:16", OPTIONS)
+        cache.close()
+
+        cache = PassageCache(tmp_path / "passages.sqlite3", max_entries=2)
+        cache.set("John 3:18", OPTIONS, "c")
+        assert cache.get("John 3:16", OPTIONS) == "a"
+        assert cache.get("John 3:17", OPTIONS) is None
@@ -0,0 +1,107 @@
+# pylint: skip-file
+
+import pytest
+
+from pylect.passageindex import (
+    LessonEntry,
+    PassageRange,
+    get_passage_index,
+    parse_scripture_reference,
+)
+
+
+class TestParseScriptureReference:
+    def test_verses(self):
+        assert parse_scripture_reference("Isaiah 40:1-11") == [
+            PassageRange("isaiah", (40, 1), (40, 11))
+        ]
+
+    def test_whole_chapter(self):
+        assert parse_scripture_reference("Romans 8") == [
+            PassageRange("romans", (8, 0), (8, 999))
+        ]
+
+    def test_across_chapters(self):
+        assert parse_scripture_reference("John 20:19-21:3") == [
+            PassageRange("john", (20, 19), (21, 3))
+        ]
+
+    def test_optional_verses(self):
+        assert parse_scripture_reference(
+            "Joshua (4:19-24); 5:1, (2-8), 9-12"
+        ) == [
+            PassageRange("joshua", (4, 19), (4, 24)),
+            PassageRange("joshua", (5, 1), (5, 1)),
+            PassageRange("joshua", (5, 2), (5, 8)),
+            PassageRange("joshua", (5, 9), (5, 12)),
+        ]
+
+    def test_optional_verses_at_start_of_chapter(self):
+        assert parse_scripture_reference("Luke 2:(1-14), 15-20") == [
+            PassageRange("luke", (2, 1), (2, 14)),
+            PassageRange("luke", (2, 15), (2, 20)),
+        ]
+
+    def test_psalm_without_colon(self):
+        assert parse_scripture_reference("Psalm 33(1-9), 10-21") == [
+            PassageRange("psalms", (33, 1), (33, 9)),
+            PassageRange("psalms", (33, 10), (33, 21)),
+        ]
+
+    def test_single_chapter_book(self):
+        assert parse_scripture_reference("Philemon 1-21") == [
+            PassageRange("philemon", (1, 1), (1, 21))
+        ]
+
+    def test_partial_verses(self):
+        assert parse_scripture_reference("Mark 1:1-8a") == [
+            PassageRange("mark", (1, 1), (1, 8))
+        ]
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            parse_scripture_reference("Magnificat")
+
+
+class TestPassageIndex:
+    index = get_passage_index()
+
+    def test_find_chapter(self):
+        entries = self.index.find("Romans 8")
+        assert (
+            LessonEntry(
+                "Trinity Sunday", "Year B", "Second Lesson", "Romans 8:12-17"
+            )
+            in entries
+        )
+        assert (
+            LessonEntry(
+                "Proper 9", "Year A", "Second Lesson", "Romans 7:21-8:6"
+            )
+            in entries
+        )
+        assert all(entry.reference.startswith("Romans") for entry in entries)
+
+    def test_find_verses(self):
+        entries = self.index.find("Isaiah 40:1-11")
+        assert (
+            LessonEntry(
+                "Second Sunday of Advent",
+                "Year B",
+                "First Lesson",
+                "Isaiah 40:1-11",
+            )
+            in entries
+        )
+
+    def test_find_service(self):
+        entries = self.index.find("Luke 2:1")
+        assert {entry.service for entry in entries} == {"I", "II"}
+        assert {entry.day_name for entry in entries} == {"Christmas Day"}
+
+    def test_find_nothing(self):
+        assert self.index.find("Obadiah 1") == []
+
+    def test_no_duplicates(self):
+        entries = self.index.find("Joshua 4-5")
+        assert len(entries) == len(set(entries))
@@ -1,8 +1,20 @@
 # pylint: skip-file
 
+import json
+from concurrent.futures import ThreadPoolExecutor
+from importlib.resources import files
+
 import pytest
 
-from pylect.psalter import Psalter
+from pylect.compiledpsalter import CompiledPsalms, compile_psalter
+from pylect.psalmformats import register_format
+from pylect.psalter import (
+    PsalmReference,
+    Psalter,
+    VerseRange,
+    get_psalter,
+    parse_psalm_reference,
+)
 
 
 class TestGetPsalm:
@@ -75,3 +87,149 @@ Dominus regit me
     def test_bad_reference_two(self):
         with pytest.raises(Exception):
             self.psalter.get_psalm("Psalm 23:7")
+
+
+class TestGetPsalms:
+    psalter = Psalter()
+
+    def test_order_and_duplicates(self):
+        refs = ["Psalm 23:4", "Psalm 1", "Psalm 23:4"]
+        texts = self.psalter.get_psalms(refs)
+        assert texts == [self.psalter.get_psalm(ref) for ref in refs]
+
+
+class TestFormats:
+    psalter = Psalter()
+
+    def test_cached(self):
+        first = self.psalter.get_psalm("Psalm 23:1-3", "markdown")
+        assert self.psalter.get_psalm("Psalm 23:1-3", "markdown") is first
+
+    def test_bulletin_marks_optional(self):
+        psalm = """Psalm 23
+Dominus regit me
+
+1 The LORD is my shepherd; *
+    therefore I can lack nothing.
+(2) He shall feed me in green pastures *
+    and lead me forth beside the waters of comfort.
+
+Verses in parentheses may be omitted."""
+        assert self.psalter.get_psalm("Psalm 23:1(2)", "bulletin") == psalm
+
+    def test_html_marks_optional(self):
+        psalm = self.psalter.get_psalm("Psalm 23:1(2)", "html")
+        assert '<p class="verse optional">' in psalm
+        assert psalm.startswith('<div class="psalm">')
+
+    def test_register_format(self):
+        register_format("numbers", lambda p, vs: str(len(vs)))
+        assert self.psalter.get_psalm("Psalm 23:1-3", "numbers") == "3"
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError):
+            self.psalter.get_psalm("Psalm 23", "pdf")
+
+
+class TestSearch:
+    psalter = Psalter()
+
+    def test_word(self):
+        assert self.psalter.search("shepherd") == [(23, 1), (49, 14), (80, 1)]
+
+    def test_phrase(self):
+        assert self.psalter.search("green pastures") == [(23, 2)]
+        assert self.psalter.search("pastures green") == []
+
+    def test_prefix(self):
+        results = self.psalter.search("shepherd*")
+        assert (23, 1) in results
+        assert set(self.psalter.search("shepherd")) <= set(results)
+
+    def test_case_and_punctuation(self):
+        assert (23, 3) in self.psalter.search("name’s SAKE")
+
+    def test_no_match(self):
+        assert self.psalter.search("zzz") == []
+        assert self.psalter.search("") == []
+
+
+class TestParsePsalmReference:
+    def test_whole_psalm(self):
+        assert parse_psalm_reference("Psalm 23") == PsalmReference(23)
+
+    def test_optional_verses(self):
+        ref = parse_psalm_reference("Psalm 107:1-3, (4-22), 23-32")
+        assert ref == PsalmReference(
+            107,
+            (
+                VerseRange(1, 3),
+                VerseRange(4, 22, optional=True),
+                VerseRange(23, 32),
+            ),
+        )
+        assert ref.verses() == list(range(1, 33))
+
+    def test_missing_colon(self):
+        assert parse_psalm_reference("Psalm 33(1-9), 10-21") == PsalmReference(
+            33, (VerseRange(1, 9, optional=True), VerseRange(10, 21))
+        )
+
+    def test_cached(self):
+        ref = parse_psalm_reference("Psalm 119:(1-8), 9-16")
+        assert parse_psalm_reference("Psalm 119:(1-8), 9-16") is ref
+
+    def test_bad_reference(self):
+        with pytest.raises(ValueError):
+            parse_psalm_reference("Magnificat")
+
+
+class TestGetPsalter:
+    def test_shared_instance(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            psalters = list(executor.map(lambda _: get_psalter(), range(8)))
+        assert all(p is psalters[0] for p in psalters)
+
+
+class TestCompiledPsalms:
+    def test_matches_json(self, tmp_path):
+        source = files("pylect.data").joinpath("psalter.json")
+        destination = tmp_path / "psalter.bin"
+        compile_psalter(source, destination)
+
+        with open(source, "r", encoding="utf-8") as f:
+            expect = json.load(f)
+        assert list(CompiledPsalms(destination)) == expect
+
+    def test_source_hash(self, tmp_path):
+        source = tmp_path / "psalter.json"
+        source.write_bytes(
+            files("pylect.data").joinpath("psalter.json").read_bytes()
+        )
+        compile_psalter(source, tmp_path / "psalter.bin")
+        assert len(CompiledPsalms(tmp_path / "psalter.bin", source)) == 150
+
+        source.write_text("[]")
+        with pytest.raises(ValueError):
+            CompiledPsalms(tmp_path / "psalter.bin", source)
+
+    def test_stale_falls_back_to_json(self, tmp_path, monkeypatch):
+        source = tmp_path / "psalter.json"
+        source.write_text(json.dumps([{"number": 1, "verses": []}]))
+        compile_psalter(
+            files("pylect.data").joinpath("psalter.json"),
+            tmp_path / "psalter.bin",
+        )
+        monkeypatch.setattr("pylect.psalter.DATA_DIR", tmp_path)
+        assert Psalter().psalms == [{"number": 1, "verses": []}]
+
+    def test_out_of_range(self, tmp_path):
+        source = files("pylect.data").joinpath("psalter.json")
+        compile_psalter(source, tmp_path / "psalter.bin")
+        with pytest.raises(IndexError):
+            CompiledPsalms(tmp_path / "psalter.bin")[150]
+
+    def test_bad_file(self, tmp_path):
+        (tmp_path / "psalter.bin").write_bytes(b"\0" * 64)
+        with pytest.raises(ValueError):
+            CompiledPsalms(tmp_path / "psalter.bin")
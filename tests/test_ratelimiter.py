@@ -0,0 +1,36 @@
+# pylint: skip-file
+
+import time
+
+from pylect.ratelimiter import RateLimiter
+
+
+class TestRateLimiter:
+    def test_remaining(self):
+        limiter = RateLimiter({"minute": (60, 60), "hour": (1000, 3600)})
+        limiter.acquire()
+        limiter.acquire()
+        assert limiter.remaining() == {"minute": 58, "hour": 998}
+
+    def test_burst_then_wait(self):
+        limiter = RateLimiter({"second": (2, 0.1)})
+        start = time.monotonic()
+        limiter.acquire()
+        limiter.acquire()
+        assert time.monotonic() - start < 0.04
+        limiter.acquire()
+        assert time.monotonic() - start >= 0.04
+
+    def test_tightest_quota(self):
+        limiter = RateLimiter({"fast": (10, 0.1), "slow": (1, 0.1)})
+        start = time.monotonic()
+        limiter.acquire()
+        limiter.acquire()
+        assert time.monotonic() - start >= 0.09
+
+    def test_pause(self):
+        limiter = RateLimiter({"minute": (60, 60)})
+        limiter.pause(0.05)
+        start = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - start >= 0.04
@@ -0,0 +1,56 @@
+# pylint: skip-file
+
+import os
+import subprocess
+import sys
+
+
+def run_python(code: str) -> str:
+    env = {k: v for k, v in os.environ.items() if k != "ESV_API_KEY"}
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return result.stdout.strip()
+
+
+class TestStartup:
+    def test_cli_defers_heavy_imports(self):
+        loaded = run_python(
+            "import sys, pylect.cli;"
+            " print([m for m in ('requests', 'dotenv', 'pyperclip')"
+            " if m in sys.modules])"
+        )
+        assert loaded == "[]"
+
+    def test_calendar_does_not_load_lectionary(self):
+        size = run_python(
+            "from datetime import date;"
+            " from pylect.compiledlectionary import get_compiled_lectionary;"
+            " from pylect.lectionary import iter_holy_days;"
+            " list(iter_holy_days(date(2024, 1, 1), date(2024, 12, 31)));"
+            " print(get_compiled_lectionary.cache_info().currsize)"
+        )
+        assert size == "0"
+
+    def test_lessons_load_lectionary(self):
+        lessons = run_python(
+            "from datetime import date;"
+            " from pylect.lectionary import Lectionary;"
+            " day = Lectionary(date(2024, 12, 1)).holy_days[0];"
+            " print(day.lessons['Gospel'])"
+        )
+        assert lessons == "('Luke 21:25-33',)"
+
+    def test_lectionary_constant(self):
+        loaded = run_python(
+            "import pylect.constants as constants;"
+            " before = constants.get_lectionary.cache_info().currsize;"
+            " days = constants.LECTIONARY;"
+            " print(before, days is constants.get_lectionary(),"
+            " 'Easter Day' in days)"
+        )
+        assert loaded == "0 True True"